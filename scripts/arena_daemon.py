@@ -0,0 +1,17 @@
+import argparse
+import logging
+
+from bot_arena.daemon import default_socket_path, serve
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a warm Stratego arena on a Unix socket")
+    parser.add_argument("--socket", type=str, default=default_socket_path(), help="Socket path")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    serve(args.socket)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import argparse
+import sys
+
+from bot_arena.event_log import events_to_text, read_events
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Convert a JSONL event log to the legacy text log")
+    parser.add_argument("events", type=str, help="Event log path (first segment if rotated)")
+    parser.add_argument("--game", type=str, default=None, help="Only convert this game id (default: every game, one block each)")
+    parser.add_argument("--output", type=str, default=None, help="Output file (default: stdout)")
+    args = parser.parse_args()
+
+    events = read_events(args.events)
+    if args.game is not None:
+        lines = events_to_text(events, game=args.game)
+    else:
+        # the stream may interleave concurrent games: emit one legacy block per game
+        by_game: dict[str, list[dict]] = {}
+        for event in events:
+            by_game.setdefault(event["game"], []).append(event)
+        lines = (line for game_events in by_game.values() for line in events_to_text(game_events))
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for line in lines:
+            out.write(line + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
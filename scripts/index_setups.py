@@ -0,0 +1,63 @@
+import argparse
+from pathlib import Path
+
+from bot_arena.setup_index import SetupIndex, build_index
+
+
+def collect_logs(paths: list[str], pattern: str) -> list[Path]:
+    """Expand directories in ``paths`` into the log files they contain."""
+
+    logs = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            logs.extend(sorted(path.rglob(pattern)))
+        else:
+            logs.append(path)
+    return logs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build or query a setup statistics index")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Index game logs")
+    build.add_argument("index", type=str, help="Output index file (.npz)")
+    build.add_argument("logs", nargs="+", help="Log files or directories")
+    build.add_argument("--pattern", type=str, default="*.log", help="Glob for logs inside directories")
+    build.add_argument("--workers", type=int, default=1, help="Number of worker processes")
+    build.add_argument("--update", action="store_true", help="Merge into an existing index")
+    build.add_argument("--no-fold-mirror", action="store_true", help="Keep mirrored setups apart")
+
+    query = sub.add_parser("query", help="Show the best setups of an index")
+    query.add_argument("index", type=str, help="Index file (.npz)")
+    query.add_argument("--top", type=int, default=10, help="Number of setups to show")
+    query.add_argument("--min-games", type=int, default=10, help="Minimum games per setup")
+    query.add_argument("--by", choices=["win_rate", "games"], default="win_rate", help="Ordering")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        index = build_index(
+            collect_logs(args.logs, args.pattern),
+            workers=args.workers,
+            fold_mirror=not args.no_fold_mirror,
+        )
+        if args.update and Path(args.index).exists():
+            previous = SetupIndex.load(args.index)
+            previous.merge(index)
+            index = previous
+        index.save(args.index)
+        print(f"{len(index)} distinct setups, {index.skipped} malformed setups skipped")
+        return
+
+    index = SetupIndex.load(args.index)
+    for stats in index.top(args.top, min_games=args.min_games, by=args.by):
+        print(
+            f"games={stats['games']} win_rate={stats['win_rate']:.3f} "
+            f"mean_plies={stats['mean_plies']:.1f}"
+        )
+        for row in stats["setup"]:
+            print("  " + row)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,16 @@
+from __future__ import annotations
+
 import argparse
+import os
 from pathlib import Path
 import subprocess
+import sys
+from typing import TYPE_CHECKING
 
-from stratego import StrategoConfig, GameMode
-from bot_arena.bot_controller import BotController
-from bot_arena.game_manager import GameManager
+# gymnasium, NumPy and the Stratego package are imported only once a game is
+# actually played in this process, keeping --help and --via-daemon fast.
+if TYPE_CHECKING:
+    from bot_arena.bot_controller import BotController
 
 
 def ensure_compiled(bot_path: Path) -> str:
@@ -28,21 +34,45 @@ def ensure_compiled(bot_path: Path) -> str:
 def create_controller(path: str | None, name: str) -> BotController | None:
     if path is None or path.lower() == "@human":
         return None
+    from bot_arena.bot_controller import BotController
+
     bot_path = ensure_compiled(Path(path))
     return BotController(bot_path, name)
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Run a Stratego game")
-    parser.add_argument("--red", type=str, default="@human", help="Path to red bot or @human")
-    parser.add_argument("--blue", type=str, default="@human", help="Path to blue bot or @human")
-    parser.add_argument("--log", type=str, default="game.log", help="Log file path")
-    parser.add_argument("--render", choices=["human", "none"], default="human", help="Render mode")
-    args = parser.parse_args()
+def run_local(args: argparse.Namespace) -> None:
+    from stratego import StrategoConfig, GameMode
+    from bot_arena.event_log import GameEventLog
+    from bot_arena.game_manager import GameManager
+    from bot_arena.hooks import profiling_hook
 
     red_bot = create_controller(args.red, "RedBot")
     blue_bot = create_controller(args.blue, "BlueBot")
     render = args.render if args.render != "none" else None
+    if args.record:
+        # frames are captured from rgb_array renders, so recording replaces the window
+        render = "rgb_array"
+    events = None
+    if args.events:
+        compression = args.events_compression if args.events_compression != "none" else None
+        events = GameEventLog(args.events, compression=compression)
+
+    hooks = []
+    if args.profile:
+        hooks.append(profiling_hook(args.profile, args.profile_format, args.profile_every))
+    if args.record:
+        from bot_arena.recorder import FrameRecorder
+
+        hooks.append(FrameRecorder(args.record, every=args.record_every, fps=args.record_fps))
+    server = None
+    if args.spectate is not None:
+        from bot_arena.spectator import SpectatorBus, SpectatorHook, SpectatorServer
+
+        bus = SpectatorBus()
+        server = SpectatorServer(bus, port=args.spectate)
+        server.start()
+        print(f"Spectators: python scripts/spectate.py --port {server.port}")
+        hooks.append(SpectatorHook(bus))
 
     gm = GameManager(
         config=StrategoConfig.from_game_mode(GameMode.ORIGINAL),
@@ -50,9 +80,110 @@ def main() -> None:
         blue_bot=blue_bot,
         render_mode=render,
         log_file=args.log,
+        event_log=events,
+        hooks=hooks,
     )
-    gm.run()
+    try:
+        gm.run()
+    finally:
+        if events is not None:
+            events.close()
+        if server is not None:
+            server.stop()
+
+
+def print_event(event: dict) -> None:
+    if event["ev"] == "move":
+        print(f"{event['turn']} {event['player']}: {event['move']} {event['outcome']}")
+    elif event["ev"] == "illegal":
+        print(f"{event['turn']} {event['player']}: {event['move']} ILLEGAL ({event['reason']})")
+    elif event["ev"] == "end":
+        print(f"Game ended with outcome {event['outcome']}, last mover {event['winner']}")
+    elif event["ev"] == "error":
+        sys.exit(f"Arena daemon error: {event['message']}")
+
+
+def run_via_daemon(args: argparse.Namespace) -> None:
+    from bot_arena.daemon import submit_game
+
+    def bot(path: str) -> str:
+        if path.lower() == "@human":
+            sys.exit("Human players cannot play through the arena daemon")
+        return os.path.abspath(ensure_compiled(Path(path)))
+
+    def absolute(path: str | None) -> str | None:
+        return os.path.abspath(path) if path else None
+
+    if args.record or args.spectate is not None:
+        sys.exit("Recording and spectating are not supported through the arena daemon")
+    if args.render != "none":
+        sys.exit("The arena daemon plays headless; pass --render none with --via-daemon")
+
+    request = {
+        "red": bot(args.red),
+        "blue": bot(args.blue),
+        "log": absolute(args.log),
+        "events": absolute(args.events),
+        "events_compression": args.events_compression if args.events_compression != "none" else None,
+        "profile": absolute(args.profile),
+        "profile_format": args.profile_format,
+        "profile_every": args.profile_every,
+    }
+    try:
+        for event in submit_game(request, args.socket):
+            print_event(event)
+    except (FileNotFoundError, ConnectionRefusedError):
+        sys.exit("No arena daemon is listening; start one with scripts/arena_daemon.py")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a Stratego game")
+    parser.add_argument("--red", type=str, default="@human", help="Path to red bot or @human")
+    parser.add_argument("--blue", type=str, default="@human", help="Path to blue bot or @human")
+    parser.add_argument(
+        "--log", type=str, default=None,
+        help="Text log path (default: game.log, or none when --events is given)",
+    )
+    parser.add_argument("--render", choices=["human", "none"], default="human", help="Render mode")
+    parser.add_argument("--events", type=str, default=None, help="Structured JSONL event log path")
+    parser.add_argument(
+        "--events-compression", choices=["gzip", "zstd", "none"], default="none",
+        help="Compression for the event log",
+    )
+    parser.add_argument("--profile", type=str, default=None, help="Write a profile of the game to this path")
+    parser.add_argument(
+        "--profile-format", choices=["pstats", "collapsed"], default="pstats",
+        help="cProfile stats or flamegraph-compatible collapsed stacks",
+    )
+    parser.add_argument(
+        "--profile-every", type=int, default=1,
+        help="Sample every N-th ply (collapsed format only)",
+    )
+    parser.add_argument(
+        "--record", type=str, default=None,
+        help="Record the game to a .gif/.mp4 file or a directory of PNG frames",
+    )
+    parser.add_argument("--record-every", type=int, default=1, help="Capture a frame every N plies")
+    parser.add_argument("--record-fps", type=float, default=5.0, help="Frame rate of the recording")
+    parser.add_argument(
+        "--spectate", type=int, default=None, metavar="PORT",
+        help="Serve live moves to scripts/spectate.py on this local port (0 picks a free one)",
+    )
+    parser.add_argument(
+        "--via-daemon", action="store_true",
+        help="Play the game in a running arena daemon (see scripts/arena_daemon.py)",
+    )
+    parser.add_argument("--socket", type=str, default=None, help="Arena daemon socket path")
+    args = parser.parse_args()
+    if args.log is None and args.events is None:
+        # the text log can be rebuilt from events, so only write it by default without them
+        args.log = "game.log"
+
+    if args.via_daemon:
+        run_via_daemon(args)
+    else:
+        run_local(args)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
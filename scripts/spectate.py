@@ -0,0 +1,39 @@
+import argparse
+import json
+import socket
+import sys
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Watch live Stratego games in the terminal")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Spectator server host")
+    parser.add_argument("--port", type=int, required=True, help="Spectator server port")
+    parser.add_argument("--list", action="store_true", help="List live games and exit")
+    parser.add_argument("game", nargs="?", default=None, help="Game id (default: latest game)")
+    args = parser.parse_args()
+
+    command = "LIST" if args.list else f"WATCH {args.game or ''}".strip()
+    with socket.create_connection((args.host, args.port)) as sock:
+        sock.sendall((command + "\n").encode("utf-8"))
+        for line in sock.makefile("r", encoding="utf-8"):
+            event = json.loads(line)
+            if args.list:
+                print(event["game"])
+            elif event.get("ev") == "error":
+                sys.exit(event["message"])
+            elif event["ev"] == "end":
+                print(f"Game over: {event['outcome']} (last mover {event['winner']})")
+            else:
+                sys.stdout.write("\x1b[2J\x1b[H")  # clear screen
+                if event["ev"] == "move":
+                    print(f"Turn {event['turn']} {event['player']}: {event['move']} {event['outcome']}")
+                else:
+                    print(f"Game {event['game']}")
+                print(f"{event['to_move']} to move\n")
+                for row in event["board"]:
+                    print(row)
+                sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
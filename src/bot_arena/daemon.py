@@ -0,0 +1,219 @@
+"""Long-lived local arena serving games over a Unix socket.
+
+The daemon keeps the interpreter, a Stratego environment and spare bot
+processes warm so that a client only pays for the game itself.  Requests and
+replies are JSON lines; a client sends one request per connection and
+receives the game's events followed by a final ``end`` (or ``error``) event.
+
+Only this module's client side is imported by ``scripts/run_game.py``, so it
+must not import gymnasium, NumPy or the Stratego package at module level.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import tempfile
+from typing import Any, Iterator
+
+
+logger = logging.getLogger(__name__)
+
+
+def default_socket_path() -> str:
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(runtime_dir, f"bot_arena-{os.getuid()}.sock")
+
+
+# ----------------------------------------------------------------------
+# client side
+def submit_game(request: dict[str, Any], socket_path: str | None = None) -> Iterator[dict[str, Any]]:
+    """Send one game request to the daemon and yield its events as they arrive."""
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path or default_socket_path())
+        sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        with sock.makefile("r", encoding="utf-8") as stream:
+            for line in stream:
+                yield json.loads(line)
+    finally:
+        sock.close()
+
+
+# ----------------------------------------------------------------------
+# server side
+class _StreamHook:
+    """Forward game events to the requesting client."""
+
+    def __init__(self, stream) -> None:
+        self.stream = stream
+
+    def _send(self, event: dict[str, Any]) -> None:
+        self.stream.write(json.dumps(event) + "\n")
+        self.stream.flush()
+
+    def after_move(self, manager, ply, player, move, outcome) -> None:
+        self._send({"ev": "move", "turn": ply, "player": player.name, "move": move, "outcome": outcome})
+
+    def on_illegal(self, manager, ply, player, move, reason) -> None:
+        self._send({"ev": "illegal", "turn": ply, "player": player.name, "move": move, "reason": reason})
+
+    def on_game_end(self, manager, outcome, winner) -> None:
+        self._send({
+            "ev": "end",
+            "game": manager.game_id,
+            "outcome": outcome,
+            "winner": winner.name if winner is not None else None,
+        })
+
+
+class ArenaDaemon(socketserver.UnixStreamServer):
+    """Unix socket server playing one game at a time in a warm interpreter.
+
+    Games are always played in the original game mode on the single warm
+    ``Stratego-v0`` environment, without rendering.
+    """
+
+    def __init__(self, socket_path: str | None = None) -> None:
+        # Import everything heavy up front: this is what clients save on.
+        import gymnasium as gym
+        import stratego
+        from .bot_controller import BotController
+        from .event_log import GameEventLog
+        from .game_manager import GameManager
+        from .hooks import profiling_hook
+        from .utils import detectors_patch
+
+        detectors_patch.install()
+        self._stratego = stratego
+        self._BotController = BotController
+        self._GameEventLog = GameEventLog
+        self._GameManager = GameManager
+        self._profiling_hook = profiling_hook
+        # one pre-spawned bot per side, for the bot that side played last
+        self._spares: dict[str, tuple[str, Any]] = {}
+
+        self.socket_path = socket_path or default_socket_path()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        super().__init__(self.socket_path, _GameRequestHandler)
+        self._env = gym.make("stratego_gym/Stratego-v0", render_mode=None)
+
+    def server_close(self) -> None:
+        super().server_close()
+        for _, bot in self._spares.values():
+            bot.end_game()
+        self._spares.clear()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def _config(self):
+        return self._stratego.StrategoConfig.from_game_mode(self._stratego.GameMode.ORIGINAL)
+
+    def _controller(self, path: str | None, name: str):
+        """Return a ready bot process, preferring a pre-spawned spare."""
+
+        spare_path, bot = self._spares.pop(name, (None, None))
+        if bot is not None and (spare_path != path or bot.process.poll() is not None):
+            bot.end_game()  # a different bot was requested; do not leave it waiting
+            bot = None
+        if path is None:
+            return None
+        return bot if bot is not None else self._BotController(path, name)
+
+    def _prespawn(self, path: str | None, name: str) -> None:
+        if path is None or name in self._spares:
+            return
+        try:
+            self._spares[name] = (path, self._BotController(path, name))
+        except OSError:
+            logger.exception("Could not pre-spawn %s", path)
+
+    def play(self, request: dict[str, Any], stream) -> None:
+        red_bot = blue_bot = events = None
+        try:
+            try:
+                red_bot = self._controller(request.get("red"), "RedBot")
+                blue_bot = self._controller(request.get("blue"), "BlueBot")
+
+                hooks: list[Any] = [_StreamHook(stream)]
+                if request.get("profile"):
+                    hooks.append(
+                        self._profiling_hook(
+                            request["profile"],
+                            request.get("profile_format", "pstats"),
+                            request.get("profile_every", 1),
+                        )
+                    )
+                if request.get("events"):
+                    events = self._GameEventLog(
+                        request["events"], compression=request.get("events_compression")
+                    )
+                gm = self._GameManager(
+                    config=self._config(),
+                    red_bot=red_bot,
+                    blue_bot=blue_bot,
+                    render_mode=None,
+                    log_file=request.get("log"),
+                    event_log=events,
+                    hooks=hooks,
+                    env=self._env,
+                )
+            except BaseException:
+                # run() was never reached, so nothing else will stop these bots
+                for bot in (red_bot, blue_bot):
+                    if bot is not None:
+                        bot.end_game()
+                raise
+            gm.run()
+        finally:
+            if events is not None:
+                events.close()
+            # get the next game's bots started while the client reads the result
+            self._prespawn(request.get("red"), "RedBot")
+            self._prespawn(request.get("blue"), "BlueBot")
+
+
+class _TextWriter:
+    """Minimal text adapter over the handler's binary socket writer."""
+
+    def __init__(self, stream) -> None:
+        self.stream = stream
+
+    def write(self, text: str) -> None:
+        self.stream.write(text.encode("utf-8"))
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+class _GameRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        writer = _TextWriter(self.wfile)
+        try:
+            request = json.loads(self.rfile.readline())
+            self.server.play(request, writer)
+        except (BrokenPipeError, ConnectionResetError):
+            logger.warning("Client disconnected during the game")
+        except Exception as exc:  # reported back instead of killing the daemon
+            logger.exception("Game failed")
+            try:
+                writer.write(json.dumps({"ev": "error", "message": str(exc)}) + "\n")
+                writer.flush()
+            except OSError:
+                pass
+
+
+def serve(socket_path: str | None = None) -> None:
+    """Run the arena daemon until interrupted."""
+
+    with ArenaDaemon(socket_path) as daemon:
+        logger.info("Arena daemon listening on %s", daemon.socket_path)
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
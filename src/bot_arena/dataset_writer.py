@@ -0,0 +1,207 @@
+"""Stream self-play observations into memory-mapped NumPy shards."""
+
+from __future__ import annotations
+
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .utils.background import BackgroundWriter
+
+
+INDEX_NAME = "index.json"
+
+_BEGIN = "begin"
+_PLY = "ply"
+_END = "end"
+
+
+def _obs_fields(obs: Any) -> dict[str, np.ndarray]:
+    if isinstance(obs, dict):
+        return {f"obs.{key}": np.array(value) for key, value in obs.items()}
+    return {"obs": np.array(obs)}
+
+
+class ObservationDatasetWriter(BackgroundWriter):
+    """Write ``(obs, action, player, reward)`` plies to rolling shard files.
+
+    Every field is stored in its own ``.npy`` file which is pre-allocated with
+    :func:`numpy.lib.format.open_memmap` when a shard is opened.  A shard is
+    closed once it holds ``max_shard_bytes`` worth of plies, so at most one
+    shard is mapped at any time.  Rows past a shard's ``rows`` count in the
+    index are unused padding.
+
+    ``index.json`` in ``directory`` maps each game id to the
+    ``[shard, start, stop]`` segments holding its plies.  Every ply carries
+    its game id, so one writer may be shared by concurrently running games;
+    their plies then interleave and each game simply spans more segments.
+    Games still open when the writer closes are indexed with
+    ``"complete": false``.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        max_shard_bytes: int = 256 * 1024 * 1024,
+        max_pending: int = 4096,
+        prefix: str = "shard",
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_shard_bytes = max_shard_bytes
+        self.prefix = prefix
+
+        # worker-side state
+        self._fields: dict[str, tuple[tuple[int, ...], np.dtype]] | None = None
+        self._rows_per_shard = 0
+        self._shard_id = -1
+        self._shard: dict[str, np.memmap] | None = None
+        self._row = 0
+        self._shards: list[dict[str, int]] = []
+        self._games: list[dict[str, Any]] = []
+        self._open: dict[str, dict[str, Any]] = {}
+
+        super().__init__(max_pending=max_pending, batch_size=256, name="dataset-writer")
+
+    # ------------------------------------------------------------------
+    # producer API (called from the game loop)
+    def begin_game(self, game_id: str | None = None) -> str:
+        game_id = game_id or uuid.uuid4().hex
+        self.submit((_BEGIN, game_id))
+        return game_id
+
+    def record(self, game_id: str, obs: Any, action: Any, player: int, reward: float) -> None:
+        self.submit((_PLY, game_id, _obs_fields(obs), np.array(action), player, reward))
+
+    def end_game(self, game_id: str) -> None:
+        self.submit((_END, game_id))
+
+    # ------------------------------------------------------------------
+    # worker implementation
+    def _handle_batch(self, batch: list[Any]) -> None:
+        for item in batch:
+            kind = item[0]
+            if kind == _PLY:
+                self._write_ply(*item[1:])
+            elif kind == _BEGIN:
+                self._game(item[1])
+            else:
+                self._close_game(item[1])
+
+    def _game(self, game_id: str) -> dict[str, Any]:
+        game = self._open.get(game_id)
+        if game is None:
+            game = self._open[game_id] = {"id": game_id, "plies": 0, "segments": []}
+        return game
+
+    def _write_ply(self, game_id: str, obs: dict[str, np.ndarray], action, player, reward) -> None:
+        game = self._game(game_id)
+        if self._fields is None:
+            self._init_fields(obs, action)
+        if self._shard is None or self._row >= self._rows_per_shard:
+            self._roll_shard()
+
+        row = self._row
+        shard = self._shard
+        for name, value in obs.items():
+            shard[name][row] = value
+        shard["action"][row] = action
+        shard["player"][row] = player
+        shard["reward"][row] = reward
+        self._row += 1
+        game["plies"] += 1
+
+        segments = game["segments"]
+        if segments and segments[-1][0] == self._shard_id and segments[-1][2] == row:
+            segments[-1][2] = row + 1
+        else:
+            segments.append([self._shard_id, row, row + 1])
+
+    def _init_fields(self, obs: dict[str, np.ndarray], action: np.ndarray) -> None:
+        fields = {name: (value.shape, value.dtype) for name, value in obs.items()}
+        fields["action"] = (action.shape, np.dtype(np.int16))
+        fields["player"] = ((), np.dtype(np.int8))
+        fields["reward"] = ((), np.dtype(np.float32))
+        row_bytes = sum(int(np.prod(shape)) * dtype.itemsize for shape, dtype in fields.values())
+        self._fields = fields
+        self._rows_per_shard = max(1, self.max_shard_bytes // row_bytes)
+
+    def _shard_path(self, shard_id: int, field: str) -> Path:
+        return self.directory / f"{self.prefix}_{shard_id:05d}.{field}.npy"
+
+    def _roll_shard(self) -> None:
+        self._close_shard()
+        self._shard_id += 1
+        self._shard = {
+            name: np.lib.format.open_memmap(
+                self._shard_path(self._shard_id, name),
+                mode="w+",
+                dtype=dtype,
+                shape=(self._rows_per_shard, *shape),
+            )
+            for name, (shape, dtype) in self._fields.items()
+        }
+        self._row = 0
+
+    def _close_game(self, game_id: str, complete: bool = True) -> None:
+        game = self._open.pop(game_id, None)
+        if game is not None:
+            game["complete"] = complete
+            self._games.append(game)
+
+    def _close_shard(self) -> None:
+        if self._shard is None:
+            return
+        for array in self._shard.values():
+            array.flush()
+        self._shards.append({"id": self._shard_id, "rows": self._row})
+        self._shard = None
+        self._write_index()
+
+    def _write_index(self) -> None:
+        index = {
+            "prefix": self.prefix,
+            "fields": {
+                name: {"shape": list(shape), "dtype": dtype.str}
+                for name, (shape, dtype) in (self._fields or {}).items()
+            },
+            "shards": self._shards,
+            "games": self._games,
+        }
+        tmp = self.directory / (INDEX_NAME + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as file:
+            json.dump(index, file)
+        os.replace(tmp, self.directory / INDEX_NAME)
+
+    def _finish(self) -> None:
+        for game_id in list(self._open):
+            self._close_game(game_id, complete=False)
+        self._close_shard()
+        self._write_index()
+
+
+def read_game(directory: str | os.PathLike, game_id: str) -> dict[str, np.ndarray]:
+    """Load every field of one recorded game from a dataset directory."""
+
+    directory = Path(directory)
+    with open(directory / INDEX_NAME, "r", encoding="utf-8") as file:
+        index = json.load(file)
+
+    for game in index["games"]:
+        if game["id"] == game_id:
+            break
+    else:
+        raise KeyError(f"Unknown game id: {game_id}")
+
+    result = {}
+    for name in index["fields"]:
+        parts = []
+        for shard_id, start, stop in game["segments"]:
+            path = directory / f"{index['prefix']}_{shard_id:05d}.{name}.npy"
+            parts.append(np.load(path, mmap_mode="r")[start:stop])
+        result[name] = np.concatenate(parts) if parts else np.empty(0)
+    return result
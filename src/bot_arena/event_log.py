@@ -0,0 +1,181 @@
+"""Buffered JSONL event stream for games with optional compression and rotation."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, IO, Iterable, Iterator
+
+from .utils.background import BackgroundWriter
+
+
+SETUP = "setup"
+MOVE = "move"
+ILLEGAL = "illegal"
+OUTCOME = "outcome"
+RESULT = "result"
+
+_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+
+def _open_write(path: Path, compression: str | None) -> IO[bytes]:
+    if compression is None:
+        return open(path, "wb")
+    if compression == "gzip":
+        return gzip.open(path, "wb", compresslevel=6)
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise ImportError("zstd compression requires the 'zstandard' package") from exc
+    return zstandard.ZstdCompressor().stream_writer(open(path, "wb"))
+
+
+def _open_read(path: Path) -> IO[bytes]:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")
+    if path.suffix == ".zst":
+        import zstandard
+
+        # the raw decompressor cannot be iterated line by line
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(open(path, "rb")))
+    return open(path, "rb")
+
+
+def segment_path(path: str | os.PathLike, index: int) -> Path:
+    """Return the file used for rotation segment ``index`` of ``path``.
+
+    Segment 0 is ``path`` itself; later ones insert a counter before the
+    extensions, e.g. ``events.jsonl.gz`` -> ``events.00001.jsonl.gz``.
+    """
+
+    path = Path(path)
+    if index == 0:
+        return path
+    stem, dot, ext = path.name.partition(".")
+    return path.with_name(f"{stem}.{index:05d}{dot}{ext}")
+
+
+class GameEventLog(BackgroundWriter):
+    """Write game events as JSON lines from a background thread.
+
+    Events are encoded and written in batches of up to ``batch_size``.  When
+    ``max_bytes`` is given the stream rotates to a new segment (see
+    :func:`segment_path`) once a segment holds that many uncompressed bytes.
+    One log can be shared by many concurrently running games; every event
+    carries the id of the game it belongs to.  Opening a log replaces any
+    previous log at ``path``, including its rotation segments.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        compression: str | None = None,
+        max_bytes: int | None = None,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+        max_pending: int = 8192,
+    ) -> None:
+        if compression not in _SUFFIXES:
+            raise ValueError("Invalid compression. Choose 'gzip', 'zstd', or None.")
+        path = Path(path)
+        suffix = _SUFFIXES[compression]
+        if suffix and path.suffix != suffix:
+            path = path.with_name(path.name + suffix)
+        self.path = path
+        self.compression = compression
+        self.max_bytes = max_bytes
+
+        # drop rotation segments of an earlier run so read_events does not chain them
+        index = 1
+        while (stale := segment_path(self.path, index)).exists():
+            stale.unlink()
+            index += 1
+
+        self._segment = 0
+        self._written = 0
+        self._file = _open_write(self.path, compression)
+        self._dirty = False
+
+        super().__init__(
+            max_pending=max_pending,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            name="event-log",
+        )
+
+    def emit(self, event: str, game: str, **fields: Any) -> None:
+        """Queue one event of type ``event`` for ``game``."""
+
+        fields["ev"] = event
+        fields["game"] = game
+        fields["ts"] = time.time()
+        self.submit(fields)
+
+    # ------------------------------------------------------------------
+    # worker implementation
+    def _handle_batch(self, batch: list[dict[str, Any]]) -> None:
+        if not batch:
+            if self._dirty:
+                self._file.flush()
+                self._dirty = False
+            return
+        data = "".join(json.dumps(event, separators=(",", ":")) + "\n" for event in batch)
+        payload = data.encode("utf-8")
+        self._file.write(payload)
+        self._written += len(payload)
+        self._dirty = True
+        if self.max_bytes is not None and self._written >= self.max_bytes:
+            self._file.close()
+            self._segment += 1
+            self._written = 0
+            self._dirty = False
+            self._file = _open_write(segment_path(self.path, self._segment), self.compression)
+
+    def _finish(self) -> None:
+        self._file.close()
+
+
+def read_events(path: str | os.PathLike) -> Iterator[dict[str, Any]]:
+    """Yield the events stored in ``path`` and any rotation segments after it."""
+
+    index = 0
+    current = segment_path(path, 0)
+    while current.exists():
+        with _open_read(current) as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+        index += 1
+        current = segment_path(path, index)
+
+
+def events_to_text(events: Iterable[dict[str, Any]], game: str | None = None) -> Iterator[str]:
+    """Reproduce the legacy text log lines (without newlines) from events.
+
+    When ``game`` is given, events of other games are skipped.  Illegal
+    attempts that ended the game without a logged move (``reason`` other than
+    ``two_square``) have no legacy line and are skipped as well.
+    """
+
+    for event in events:
+        if game is not None and event["game"] != game:
+            continue
+        kind = event["ev"]
+        if kind == SETUP:
+            yield f"{event['name']} {event['color']} SETUP"
+            yield from event["rows"]
+        elif kind == MOVE:
+            yield f"{event['turn']} {event['color']}: {event['move']} {event['outcome']}"
+        elif kind == ILLEGAL:
+            if event.get("reason", "two_square") != "two_square":
+                continue
+            yield f"{event['turn']} {event['color']}: {event['move']} {event['outcome']} (2‑square)"
+        elif kind == RESULT:
+            yield (
+                f"{event['winner_path']} {event['winner']} VICTORY {event['turns']} "
+                f"{event['red_remaining']} {event['blue_remaining']}"
+            )
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Optional
+import uuid
+from typing import Optional, Sequence
 
 import gymnasium as gym
 import numpy as np
@@ -15,23 +16,31 @@ from stratego import (
 )
 
 from .bot_controller import BotController
-from .utils import  detectors_patch
+from .dataset_writer import ObservationDatasetWriter
+from . import event_log as ev
+from .event_log import GameEventLog
+from .hooks import GameHooks, bind_hooks
+from .utils import detectors_patch
+from .utils import move_parser as mp
 from .utils.move_parser import (
+    Move,
+    Outcome,
+    OutcomeKind,
+    PIECE_TOKENS,
     parse_move,
     parse_setup,
     setup_to_action,
     src_dest_from_move,
-    TOKEN_TO_PIECE,
 )
 
 
 logger = logging.getLogger(__name__)
 
+# Outcome reported to ``on_game_end`` hooks when a game is aborted by an exception.
+ABORTED = "ABORTED"
 
-class GameManager:
-
-    piece_to_token = {v: k for k, v in TOKEN_TO_PIECE.items()}
 
+class GameManager:
     def __init__(
         self,
         config: StrategoConfigBase,
@@ -39,13 +48,21 @@ class GameManager:
         blue_bot: Optional[BotController] = None,
         render_mode: Optional[str] = "human",
         log_file: Optional[str] = None,
+        dataset_writer: Optional[ObservationDatasetWriter] = None,
+        event_log: Optional[GameEventLog] = None,
+        hooks: Sequence[GameHooks] = (),
+        env: Optional[gym.Env] = None,
     ):
         self.config = config
         self.render_mode = render_mode
         if render_mode not in [None, "human", "rgb_array"]:
             raise ValueError("Invalid render mode. Choose 'human', 'rgb_array', or None.")
         
-        if isinstance(self.config, StrategoConfig):
+        detectors_patch.install()
+        if env is not None:
+            # pre-built (e.g. kept warm by the arena daemon); must match config and render mode
+            self.env = env
+        elif isinstance(self.config, StrategoConfig):
             self.env = gym.make("stratego_gym/Stratego-v0", render_mode=self.render_mode)
         elif isinstance(self.config, StrategoConfigCpp):
             self.env = gym.make("stratego_gym/StrategoCpp-v0", render_mode=self.render_mode)
@@ -57,6 +74,29 @@ class GameManager:
         self.blue_bot = blue_bot
         self.log_file = log_file
         self._log = open(log_file, "w", encoding="utf-8") if log_file else None
+        self.dataset_writer = dataset_writer
+        self.event_log = event_log
+        self._console = self._log is None and event_log is None
+        self.game_id: str | None = None
+        self._game_ended = False
+
+        # Resolve hooks once so that absent callbacks cost a single ``None`` check.
+        bound = bind_hooks(hooks)
+        self._on_setup = bound["on_setup"]
+        self._before_move = bound["before_move"]
+        self._after_move = bound["after_move"]
+        self._on_illegal = bound["on_illegal"]
+        self._on_game_end = bound["on_game_end"]
+
+    def _step(self, action):
+        """Step the environment, streaming the ply to the dataset writer if any."""
+
+        if self.dataset_writer is None:
+            return self.env.step(action)
+        player = self.env.player
+        result = self.env.step(action)
+        self.dataset_writer.record(self.game_id, result[0], action, player.value, result[1])
+        return result
 
     def setup(
         self,
@@ -116,7 +156,7 @@ class GameManager:
                     action = (10 - action[1] - 1, 10 - action[0] - 1)
                 else:
                     action = self.env.action_space.sample()  # Random action if no setup provided
-                self.env.step(action)
+                self._step(action)
                 red_turn += 1
             else:
                 if blue_setup is not None:
@@ -125,7 +165,7 @@ class GameManager:
                 else:
                     action = self.env.action_space.sample()  # Random action if no setup provided
 
-                self.env.step(action)
+                self._step(action)
                 blue_turn += 1
 
         return raw_red, raw_blue
@@ -142,7 +182,7 @@ class GameManager:
                 elif val == Piece.LAKE.value or val == -Piece.LAKE.value:
                     row_chars.append("+")
                 elif val > 0:
-                    row_chars.append(self.piece_to_token.get(Piece(val), "?"))
+                    row_chars.append(PIECE_TOKENS[val])
                 else:
                     row_chars.append("#")
             lines.append("".join(row_chars))
@@ -152,28 +192,31 @@ class GameManager:
 
         return lines
 
-    def _move_to_str(self, move):
-        x, y, direction, mult = move
-        return f"{x} {y} {direction}" + (f" {mult}" if mult != 1 else "")
-
-    def _compute_outcome(self, before, after, src, dst):
-        atk = before[src]
-        defn = before[dst]
-        after_dst = after[dst]
+    def _compute_outcome(self, before, after, src, dst) -> Outcome:
+        atk = int(before[src])
+        defn = int(before[dst])
+        after_dst = int(after[dst])
         if defn == Piece.EMPTY.value:
-            return "OK"
-        atk_token = self.piece_to_token.get(Piece(abs(int(atk))), "?")
-        def_token = self.piece_to_token.get(Piece(abs(int(defn))), "?")
+            return mp.OK
         if defn == -Piece.FLAG.value:
-            return "VICTORY_FLAG"
+            return mp.VICTORY_FLAG
         if after_dst == atk:
-            return f"KILLS {atk_token} {def_token}"
+            kind = OutcomeKind.KILLS
         elif after_dst == defn:
-            return f"DIES {atk_token} {def_token}"
+            kind = OutcomeKind.DIES
         elif after_dst == Piece.EMPTY.value:
-            return f"BOTHDIE {atk_token} {def_token}"
+            kind = OutcomeKind.BOTHDIE
         else:
-            return "ILLEGAL"
+            return mp.ILLEGAL
+        return Outcome.combat(kind, abs(atk), abs(defn))
+
+    def _emit_illegal(self, turn: int, player: Player, move: str, reason: str) -> None:
+        if self.event_log is not None:
+            self.event_log.emit(
+                ev.ILLEGAL, self.game_id, turn=turn,
+                color="RED" if player == Player.RED else "BLU",
+                move=move, outcome=mp.ILLEGAL.text, reason=reason,
+            )
 
     def _get_move_from_human(self):
         return input("Enter move (x y DIRECTION [MULT]) or SURRENDER: ")
@@ -189,28 +232,74 @@ class GameManager:
         If a player violates the rule they receive *one* chance to pick
         another move; on a second consecutive violation they immediately
         lose by *ILLEGAL*.
+
+        Bot processes are shut down and the log file is closed even when the
+        game is aborted by an exception (e.g. a bot timing out).
         """
 
+        result = ""
+        self._game_ended = False
+        try:
+            result = self._play(red_setup, blue_setup)
+        finally:
+            if not self._game_ended and self._on_game_end is not None:
+                # let hooks tear down (stop profilers, finalise files) on abort too
+                try:
+                    self._on_game_end(self, ABORTED, None)
+                except Exception:
+                    logger.exception("on_game_end hook failed for aborted game %s", self.game_id)
+            if self.red_bot is not None:
+                self.red_bot.end_game(result)
+            if self.blue_bot is not None:
+                self.blue_bot.end_game(result)
+            if self._log is not None:
+                self._log.close()
+
+    def _play(
+        self,
+        red_setup: str | list[list[Piece]] | None,
+        blue_setup: str | list[list[Piece]] | None,
+    ) -> str:
+        """Play the game itself and return its final outcome."""
+
         # ---------------------------------------------------------------------
         #  INITIAL SET‑UP (unchanged)
         # ---------------------------------------------------------------------
+        self.game_id = uuid.uuid4().hex
+        if self.dataset_writer is not None:
+            self.dataset_writer.begin_game(self.game_id)
         raw_red, raw_blue = self.setup(red_setup, blue_setup)
 
+        red_name = self.red_bot.path if self.red_bot else "HUMAN"
+        blue_name = self.blue_bot.path if self.blue_bot else "HUMAN"
         if self._log:
-            red_name = self.red_bot.path if self.red_bot else "HUMAN"
             self._log.write(f"{red_name} RED SETUP\n")
             if raw_red:
                 for line in raw_red.splitlines():
                     self._log.write(line + "\n")
-            blue_name = self.blue_bot.path if self.blue_bot else "HUMAN"
             self._log.write(f"{blue_name} BLUE SETUP\n")
             if raw_blue:
                 for line in raw_blue.splitlines():
                     self._log.write(line + "\n")
+        if self.event_log is not None:
+            self.event_log.emit(
+                ev.SETUP, self.game_id, color="RED", name=red_name,
+                rows=raw_red.splitlines() if raw_red else [],
+            )
+            self.event_log.emit(
+                ev.SETUP, self.game_id, color="BLUE", name=blue_name,
+                rows=raw_blue.splitlines() if raw_blue else [],
+            )
+        if self._on_setup is not None:
+            self._on_setup(self, raw_red, raw_blue)
+
+        before_move = self._before_move
+        after_move = self._after_move
+        on_illegal = self._on_illegal
 
-        last_move: tuple[int, int, str, int] | None = None
+        last_move: Move | None = None
         last_player: Player | None = None
-        outcome = "OK"
+        outcome = mp.OK
         terminated = False
         turn_num = 1
 
@@ -227,6 +316,8 @@ class GameManager:
             player: Player = self.env.player
             board_lines = self.board_to_str(player)
             controller = self.red_bot if player == Player.RED else self.blue_bot
+            if before_move is not None:
+                before_move(self, turn_num, player)
 
             # ------------------------------------------------------------------
             #  NEW : If the *current* player already committed a two‑square
@@ -236,20 +327,20 @@ class GameManager:
             if two_square_retries[player] == 1:
                 msg = "NO_MOVE"
             else:
-                msg = self._move_to_str(last_move) if last_move is not None else "START"
+                msg = last_move.encode() if last_move is not None else "START"
 
             # ------------------------------------------------------------------
             #  SOLICIT MOVE
             # ------------------------------------------------------------------
             if controller is not None:
-                move_str = controller.request_move(msg, outcome, board_lines)
+                move_str = controller.request_move(msg, outcome.text, board_lines)
             else:
                 print("Last move:", msg, outcome)
                 for line in board_lines:
                     print(line)
                 move_str = self._get_move_from_human()
 
-            if self._log is None:
+            if self._console:
                 # console debug
                 logger.info(
                     "Move from %s: %s",
@@ -259,24 +350,30 @@ class GameManager:
 
             parsed = parse_move(move_str)
             if parsed in {"SURRENDER", "QUIT"}:
-                outcome = "SURRENDER"
+                outcome = mp.SURRENDER
                 terminated = True
                 break
             if parsed == "NO_MOVE" or parsed is None:
-                outcome = "ILLEGAL"
+                outcome = mp.ILLEGAL
                 terminated = True
+                self._emit_illegal(turn_num, player, move_str.strip(), "no_move")
+                if on_illegal is not None:
+                    on_illegal(self, turn_num, player, move_str, "no_move")
                 break
 
             # --------------------------------------------------------------
             #  Convert the textual move into *src* and *dst* indices
             # --------------------------------------------------------------
-            src, dst = src_dest_from_move(*parsed, player, self.config.height, self.config.width)
+            src, dst = src_dest_from_move(parsed, player, self.config.height, self.config.width)
 
             # 1) SOURCE SQUARE MUST CONTAIN A SELECTABLE PIECE
             valid_select = self.env.valid_pieces_to_select()[src]
             if not valid_select:
-                outcome = "ILLEGAL"
+                outcome = mp.ILLEGAL
                 terminated = True
+                self._emit_illegal(turn_num, player, parsed.encode(), "invalid_select")
+                if on_illegal is not None:
+                    on_illegal(self, turn_num, player, move_str, "invalid_select")
                 break
 
             # --------------------------------------------------------------
@@ -288,18 +385,20 @@ class GameManager:
             if not two_square_ok:
                 # First or second consecutive violation?
                 two_square_retries[player] += 1
-                outcome = "ILLEGAL"
+                outcome = mp.ILLEGAL
 
                 # Tell the (still current) controller that their move failed.
                 if controller is not None:
-                    controller.confirm_result(move_str, outcome)
+                    controller.confirm_result(move_str, outcome.text)
 
                 # Logging of the illegal attempt
+                color_str = "RED" if player == Player.RED else "BLU"
+                move_text = parsed.encode()
                 if self._log:
-                    color_str = "RED" if player == Player.RED else "BLU"
-                    self._log.write(
-                        f"{turn_num} {color_str}: {self._move_to_str(parsed)} {outcome} (2‑square)\n"
-                    )
+                    self._log.write(f"{turn_num} {color_str}: {move_text} {outcome} (2‑square)\n")
+                self._emit_illegal(turn_num, player, move_text, "two_square")
+                if on_illegal is not None:
+                    on_illegal(self, turn_num, player, move_str, "two_square")
 
                 # Second consecutive violation ‑> game over.
                 if two_square_retries[player] >= 2:
@@ -307,7 +406,7 @@ class GameManager:
                 else:
                     # Give the same player another chance.  The opponent will
                     # subsequently see *NO_MOVE*.
-                    outcome = "OK"  # protocol requires some outcome for next prompt
+                    outcome = mp.OK  # protocol requires some outcome for next prompt
                     # Do *not* advance the turn counter because the move was not executed.
                     continue
 
@@ -317,10 +416,10 @@ class GameManager:
             # --------------------------------------------------------------
             # 3) PROCEED WITH THE NORMAL TWO‑STEP MOVE SELECTION
             # --------------------------------------------------------------
-            self.env.step(src)
+            self._step(src)
             if self.env.valid_destinations()[dst]:
                 before = self.env.board.copy()
-                obs, reward, term, trunc, info = self.env.step(dst)
+                obs, reward, term, trunc, info = self._step(dst)
                 after = np.rot90(self.env.board, 2) * -1
                 outcome = self._compute_outcome(before, after, src, dst)
                 terminated = term or trunc
@@ -328,30 +427,38 @@ class GameManager:
                 last_player = player
             else:
                 # destination itself illegal for some other reason
-                outcome = "ILLEGAL"
+                outcome = mp.ILLEGAL
                 terminated = True
+                if on_illegal is not None:
+                    on_illegal(self, turn_num, player, move_str, "invalid_destination")
 
             # --------------------------------------------------------------
             # 4) LOGGING + TURN ACCOUNTING
             # --------------------------------------------------------------
-            if self._log is None:
+            if self._console:
                 logger.info("Outcome: %s", outcome)
 
+            color_str = "RED" if player == Player.RED else "BLU"
+            move_text = parsed.encode()
             if self._log:
-                color_str = "RED" if player == Player.RED else "BLU"
-                self._log.write(
-                    f"{turn_num} {color_str}: {self._move_to_str(parsed)} {outcome}\n"
+                self._log.write(f"{turn_num} {color_str}: {move_text} {outcome}\n")
+            if self.event_log is not None:
+                self.event_log.emit(
+                    ev.MOVE, self.game_id, turn=turn_num, color=color_str,
+                    move=move_text, outcome=outcome.text,
                 )
-                turn_num += 1
+            if after_move is not None:
+                after_move(self, turn_num, player, move_str, outcome.text)
+            turn_num += 1
 
             # Inform the controller about the outcome of *its own* move.
             if controller is not None and not terminated:
-                controller.confirm_result(self._move_to_str(last_move), outcome)
+                controller.confirm_result(last_move.encode(), outcome.text)
 
         # ------------------------------------------------------------------
         #  GAME HAS ENDED
         # ------------------------------------------------------------------
-        if self._log is None:
+        if self._console:
             logger.info("Game ended with outcome: %s", outcome)
 
         red_remaining = int(
@@ -361,17 +468,24 @@ class GameManager:
             np.sum((self.env.board < 0) & (self.env.board != -Piece.LAKE.value))
         )
 
+        winner = "RED" if last_player == Player.RED else "BLUE"
+        winner_path = red_name if last_player == Player.RED else blue_name
         if self._log:
-            winner = "RED" if last_player == Player.RED else "BLUE"
-            winner_path = self.red_bot.path if last_player == Player.RED else self.blue_bot.path
             self._log.write(
                 f"{winner_path} {winner} VICTORY {turn_num-1} {red_remaining} {blue_remaining}\n"
             )
+        if self.event_log is not None:
+            self.event_log.emit(ev.OUTCOME, self.game_id, outcome=outcome.text)
+            self.event_log.emit(
+                ev.RESULT, self.game_id, winner=winner, winner_path=winner_path,
+                turns=turn_num - 1, red_remaining=red_remaining, blue_remaining=blue_remaining,
+            )
 
-        if self.red_bot is not None:
-            self.red_bot.end_game(outcome)
-        if self.blue_bot is not None:
-            self.blue_bot.end_game(outcome)
+        self._game_ended = True
+        if self._on_game_end is not None:
+            self._on_game_end(self, outcome.text, last_player)
+
+        if self.dataset_writer is not None:
+            self.dataset_writer.end_game(self.game_id)
 
-        if self._log is not None:
-            self._log.close()
+        return outcome.text
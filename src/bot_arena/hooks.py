@@ -0,0 +1,186 @@
+"""Lifecycle callbacks for :class:`~bot_arena.game_manager.GameManager`."""
+
+from __future__ import annotations
+
+import cProfile
+import os
+import sys
+import threading
+from collections import Counter
+from typing import Any, Callable, Iterable
+
+
+HOOK_NAMES = ("on_setup", "before_move", "after_move", "on_illegal", "on_game_end")
+
+
+class GameHooks:
+    """Base class for game hooks; override only the callbacks you need.
+
+    Callbacks that are not overridden are never called, so they cost nothing
+    during a game.  ``ply`` is the number of the turn being played and
+    ``move`` the raw move string received from the player.
+    """
+
+    def on_setup(self, manager, raw_red: str | None, raw_blue: str | None) -> None:
+        """Called once both setups have been placed on the board."""
+
+    def before_move(self, manager, ply: int, player) -> None:
+        """Called before a move is requested from ``player``."""
+
+    def after_move(self, manager, ply: int, player, move: str, outcome: str) -> None:
+        """Called after a move has been executed with its ``outcome``."""
+
+    def on_illegal(self, manager, ply: int, player, move: str, reason: str) -> None:
+        """Called when ``player`` attempts an illegal move."""
+
+    def on_game_end(self, manager, outcome: str, winner) -> None:
+        """Called once the game has ended, before the bots are shut down.
+
+        Also called with ``outcome="ABORTED"`` and no winner when the game is
+        aborted by an exception, possibly before :meth:`on_setup` ran, so
+        implementations must tolerate missing setup state.
+        """
+
+
+def _fan_out(callbacks: list[Callable[..., Any]]) -> Callable[..., None]:
+    def dispatch(*args: Any) -> None:
+        for callback in callbacks:
+            callback(*args)
+
+    return dispatch
+
+
+def bind_hooks(hooks: Iterable[Any]) -> dict[str, Callable[..., Any] | None]:
+    """Resolve ``hooks`` into one pre-bound callable (or ``None``) per event.
+
+    Hooks need not subclass :class:`GameHooks`; any object providing some of
+    the callback methods is accepted.
+    """
+
+    hooks = list(hooks)
+    bound = {}
+    for name in HOOK_NAMES:
+        default = getattr(GameHooks, name)
+        callbacks = [
+            getattr(hook, name)
+            for hook in hooks
+            if getattr(type(hook), name, default) is not default
+        ]
+        if not callbacks:
+            bound[name] = None
+        elif len(callbacks) == 1:
+            bound[name] = callbacks[0]
+        else:
+            bound[name] = _fan_out(callbacks)
+    return bound
+
+
+# ----------------------------------------------------------------------
+# built-in profiling hooks
+class CProfileHook(GameHooks):
+    """Profile every game with :mod:`cProfile`.
+
+    Profiling starts once the setup is placed and stops when the game ends.
+    If ``path`` is given the stats are dumped there after each game; a
+    ``{game}`` placeholder is replaced by the game id.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path
+        self.profile: cProfile.Profile | None = None
+        self._running = False
+
+    def on_setup(self, manager, raw_red, raw_blue) -> None:
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+        self._running = True
+
+    def on_game_end(self, manager, outcome, winner) -> None:
+        if not self._running:
+            return
+        self._running = False
+        self.profile.disable()
+        if self.path:
+            self.profile.dump_stats(self.path.format(game=manager.game_id))
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSamplerHook(GameHooks):
+    """Sample the game thread's stack while every ``every``-th ply is played.
+
+    A daemon thread takes one sample per ``interval`` seconds during sampled
+    plies and sleeps otherwise.  Samples are aggregated in :attr:`stacks` and,
+    if ``path`` is given, written after each game in the collapsed-stack
+    format understood by ``flamegraph.pl`` and speedscope.
+    """
+
+    def __init__(self, every: int = 1, interval: float = 0.001, path: str | None = None) -> None:
+        self.every = max(1, every)
+        self.interval = interval
+        self.path = path
+        self.stacks: Counter[str] = Counter()
+        self._active = threading.Event()
+        self._stop = threading.Event()
+        self._target: int | None = None
+        self._thread: threading.Thread | None = None
+
+    def on_setup(self, manager, raw_red, raw_blue) -> None:
+        self.stacks = Counter()
+        self._target = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def before_move(self, manager, ply, player) -> None:
+        if ply % self.every == 0:
+            self._active.set()
+
+    def after_move(self, manager, ply, player, move, outcome) -> None:
+        self._active.clear()
+
+    def on_illegal(self, manager, ply, player, move, reason) -> None:
+        self._active.clear()
+
+    def on_game_end(self, manager, outcome, winner) -> None:
+        self._active.clear()
+        self._stop.set()
+        if self._thread is None:
+            return
+        self._thread.join()
+        self._thread = None
+        if self.path:
+            self.write(self.path.format(game=manager.game_id))
+
+    def write(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as file:
+            for stack, count in self.stacks.most_common():
+                file.write(f"{stack} {count}\n")
+
+    def _sample(self) -> None:
+        me = threading.get_ident()
+        while not self._stop.is_set():
+            if not self._active.wait(timeout=0.1):
+                continue
+            frame = sys._current_frames().get(self._target)
+            if frame is None or self._target == me:
+                return
+            names = []
+            while frame is not None:
+                names.append(_frame_name(frame))
+                frame = frame.f_back
+            self.stacks[";".join(reversed(names))] += 1
+            self._stop.wait(self.interval)
+
+
+def profiling_hook(path: str, fmt: str = "pstats", every: int = 1) -> GameHooks:
+    """Return the built-in profiling hook writing ``fmt`` output to ``path``."""
+
+    if fmt == "pstats":
+        return CProfileHook(path)
+    if fmt == "collapsed":
+        return StackSamplerHook(every=every, path=path)
+    raise ValueError("Invalid profile format. Choose 'pstats' or 'collapsed'.")
@@ -0,0 +1,210 @@
+"""Record ``rgb_array`` games to GIF/MP4 or numbered PNGs off the game loop."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import shutil
+import struct
+import subprocess
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+from .hooks import GameHooks
+from .utils.background import BackgroundWriter
+
+
+logger = logging.getLogger(__name__)
+
+
+# ----------------------------------------------------------------------
+# encoders
+def write_png(path: str | Path, frame: np.ndarray) -> None:
+    """Write an RGB or RGBA ``uint8`` frame as a PNG using only the stdlib."""
+
+    height, width, channels = frame.shape
+    color_type = {3: 2, 4: 6}[channels]
+    scanlines = np.zeros((height, 1 + width * channels), dtype=np.uint8)  # filter byte 0
+    scanlines[:, 1:] = frame.reshape(height, -1)
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+    with open(path, "wb") as file:
+        file.write(b"\x89PNG\r\n\x1a\n")
+        file.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0)))
+        file.write(chunk(b"IDAT", zlib.compress(scanlines.tobytes(), 6)))
+        file.write(chunk(b"IEND", b""))
+
+
+class _PngEncoder:
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.count = 0
+
+    def write(self, frame: np.ndarray) -> None:
+        write_png(self.directory / f"frame_{self.count:06d}.png", frame)
+        self.count += 1
+
+    def close(self) -> None:
+        pass
+
+
+class _ImageioEncoder:
+    def __init__(self, path: Path, fps: float) -> None:
+        import imageio.v2 as imageio
+
+        self.writer = imageio.get_writer(path, fps=fps)
+
+    def write(self, frame: np.ndarray) -> None:
+        self.writer.append_data(frame)
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class _FfmpegEncoder:
+    def __init__(self, path: Path, fps: float, frame_shape: tuple[int, ...]) -> None:
+        height, width, channels = frame_shape
+        self.process = subprocess.Popen(
+            [
+                shutil.which("ffmpeg"), "-loglevel", "error", "-y",
+                "-f", "rawvideo", "-pix_fmt", "rgb24" if channels == 3 else "rgba",
+                "-s", f"{width}x{height}", "-r", str(fps), "-i", "-",
+                *(["-pix_fmt", "yuv420p"] if path.suffix == ".mp4" else []),
+                str(path),
+            ],
+            stdin=subprocess.PIPE,
+        )
+
+    def write(self, frame: np.ndarray) -> None:
+        self.process.stdin.write(frame.tobytes())
+
+    def close(self) -> None:
+        self.process.stdin.close()
+        self.process.wait()
+
+
+def _make_encoder(path: Path, fps: float, frame_shape: tuple[int, ...]):
+    if path.suffix.lower() in (".gif", ".mp4"):
+        try:
+            return _ImageioEncoder(path, fps)
+        except ImportError:
+            pass
+        except (ValueError, RuntimeError) as exc:
+            # imageio is installed but has no backend for this format
+            logger.warning("imageio cannot write %s (%s), trying ffmpeg", path, exc)
+        if shutil.which("ffmpeg"):
+            return _FfmpegEncoder(path, fps, frame_shape)
+        directory = path.with_name(path.stem + "_frames")
+        logger.warning("Neither imageio nor ffmpeg can write %s, writing PNG frames to %s", path, directory)
+        return _PngEncoder(directory)
+    return _PngEncoder(path)
+
+
+class _EncoderWorker(BackgroundWriter):
+    """Encode frames from the recorder's buffer ring on a background thread."""
+
+    def __init__(self, path: Path, fps: float, buffers: list[np.ndarray], free: queue.Queue) -> None:
+        self.path = path
+        self.fps = fps
+        self.buffers = buffers
+        self.free = free
+        self.encoder = None
+        self.failed = False
+        super().__init__(max_pending=len(buffers), batch_size=len(buffers), name="frame-encoder")
+
+    def _handle_batch(self, batch: list[int]) -> None:
+        for slot in batch:
+            try:
+                if not self.failed:
+                    frame = self.buffers[slot]
+                    if self.encoder is None:
+                        self.encoder = _make_encoder(self.path, self.fps, frame.shape)
+                    self.encoder.write(frame)
+            except Exception:
+                # a broken replay must never stall or abort the game itself
+                logger.exception("Encoding %s failed, dropping the remaining frames", self.path)
+                self.failed = True
+            finally:
+                self.free.put(slot)
+
+    def _finish(self) -> None:
+        if self.encoder is not None:
+            try:
+                self.encoder.close()
+            except Exception:
+                logger.exception("Finalising %s failed", self.path)
+
+
+# ----------------------------------------------------------------------
+# hook
+class FrameRecorder(GameHooks):
+    """Capture a frame every ``every`` plies and encode the replay in the background.
+
+    Requires a :class:`~bot_arena.game_manager.GameManager` created with
+    ``render_mode="rgb_array"``.  Frames are copied into a ring of
+    ``ring_size`` pre-allocated buffers; the game only waits when all of them
+    are still queued for encoding.  ``path`` picks the output: ``.gif`` or
+    ``.mp4`` (through imageio or a local ``ffmpeg``, falling back to PNGs),
+    anything else is a directory of numbered PNG frames.  A ``{game}``
+    placeholder in ``path`` is replaced by the game id.
+    """
+
+    def __init__(self, path: str, every: int = 1, fps: float = 5.0, ring_size: int = 32) -> None:
+        self.path = path
+        self.every = max(1, every)
+        self.fps = fps
+        self.ring_size = ring_size
+        self._buffers: list[np.ndarray] = []
+        self._free: queue.Queue[int] = queue.Queue()
+        self._worker: _EncoderWorker | None = None
+        self._game_id: str | None = None
+        self._stale = False
+
+    def capture(self, manager) -> None:
+        frame = manager.env.render()
+        if frame is None:
+            return
+        if not self._buffers:
+            self._allocate(frame)
+        slot = self._free.get()
+        np.copyto(self._buffers[slot], frame)
+        self._worker.submit(slot)
+
+    def _allocate(self, frame: np.ndarray) -> None:
+        self._buffers = [np.empty_like(frame, dtype=np.uint8) for _ in range(self.ring_size)]
+        self._free = queue.Queue()
+        for slot in range(self.ring_size):
+            self._free.put(slot)
+        path = Path(self.path.format(game=self._game_id))
+        self._worker = _EncoderWorker(path, self.fps, self._buffers, self._free)
+
+    def on_setup(self, manager, raw_red, raw_blue) -> None:
+        if manager.render_mode != "rgb_array":
+            raise ValueError("FrameRecorder requires render_mode='rgb_array'.")
+        self._game_id = manager.game_id
+        self._buffers = []
+        self.capture(manager)
+
+    def after_move(self, manager, ply, player, move, outcome) -> None:
+        self._stale = ply % self.every != 0
+        if not self._stale:
+            self.capture(manager)
+
+    def on_game_end(self, manager, outcome, winner) -> None:
+        if self._worker is None:
+            return  # aborted before the first frame, or already finished
+        try:
+            if self._stale:
+                self.capture(manager)
+        except Exception:
+            # also reached for aborted games; keep the frames encoded so far
+            logger.exception("Capturing the final frame of %s failed", self._game_id)
+        finally:
+            worker, self._worker = self._worker, None
+            self._stale = False
+            worker.close()
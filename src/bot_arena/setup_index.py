@@ -0,0 +1,286 @@
+"""Win/loss statistics of opening setups aggregated over game logs."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from .utils.move_parser import TOKEN_TO_PIECE
+
+
+# Tokens that may appear in a setup, in heatmap order.
+SETUP_TOKENS = "".join(t for t in TOKEN_TO_PIECE if t not in ".+")
+_TOKEN_INDEX = np.full(256, -1, dtype=np.int8)
+for _i, _t in enumerate(SETUP_TOKENS):
+    _TOKEN_INDEX[ord(_t)] = _i
+
+# Columns of ``SetupIndex.counts``.
+GAMES, WINS, LOSSES, PLIES = range(4)
+
+
+def iter_games(path: str | os.PathLike) -> Iterator[tuple[list[str], list[str], str, int]]:
+    """Stream ``(red_rows, blue_rows, winner, plies)`` from a text game log.
+
+    Files holding several concatenated games are supported; games without a
+    final ``VICTORY`` line are skipped.
+    """
+
+    red: list[str] = []
+    blue: list[str] = []
+    current: list[str] | None = None
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if line.endswith(" RED SETUP"):
+                red, blue = [], []
+                current = red
+            elif line.endswith(" BLUE SETUP"):
+                current = blue
+            elif " VICTORY " in line:
+                _, winner, _, plies, _, _ = line.rsplit(None, 5)
+                yield red, blue, winner, int(plies)
+                current = None
+            elif current is not None:
+                if ":" in line:
+                    current = None  # first move line, setup is over
+                elif line:
+                    current.append(line)
+
+
+class SetupIndex:
+    """Count table of setups keyed by a 64-bit hash of their canonical form.
+
+    Per setup the index stores games, wins, losses and total plies in
+    :attr:`counts` (rows aligned with the sorted :attr:`keys`).  Independently
+    it keeps per piece/position heatmaps of games played and won, counted in
+    the orientation the setups were actually played.  With ``fold_mirror`` a
+    setup and its left-right mirror image share one entry in :attr:`counts`.
+    Indexes built by separate workers are combined with :meth:`merge`.
+    """
+
+    def __init__(self, rows: int = 4, cols: int = 10, fold_mirror: bool = True) -> None:
+        self.rows = rows
+        self.cols = cols
+        self.fold_mirror = fold_mirror
+        self.keys = np.empty(0, dtype=np.uint64)
+        self.setups = np.empty(0, dtype=f"S{rows * cols}")
+        self.counts = np.empty((0, 4), dtype=np.int64)
+        self.heat_games = np.zeros((len(SETUP_TOKENS), rows, cols), dtype=np.int64)
+        self.heat_wins = np.zeros_like(self.heat_games)
+        self.skipped = 0
+        self._pending: dict[int, list] = {}
+        self._rr, self._cc = np.indices((rows, cols))
+
+    # ------------------------------------------------------------------
+    # building
+    def _encode(self, rows: Iterable[str]) -> bytes | None:
+        """Return ``rows`` as validated bytes, as played, or ``None`` if malformed."""
+
+        rows = [row.strip() for row in rows]
+        if len(rows) != self.rows or any(len(row) != self.cols for row in rows):
+            return None
+        data = "".join(rows).encode("ascii", "replace")
+        if (_TOKEN_INDEX[np.frombuffer(data, dtype=np.uint8)] < 0).any():
+            return None
+        return data
+
+    def _fold(self, data: bytes) -> bytes:
+        if not self.fold_mirror:
+            return data
+        grid = np.frombuffer(data, dtype=np.uint8).reshape(self.rows, self.cols)
+        return min(data, grid[:, ::-1].tobytes())
+
+    def canonical(self, rows: Iterable[str]) -> bytes | None:
+        """Return the canonical byte form of ``rows`` or ``None`` if malformed."""
+
+        data = self._encode(rows)
+        return None if data is None else self._fold(data)
+
+    @staticmethod
+    def hash_setup(data: bytes) -> int:
+        return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+    def add_game(self, red_rows: list[str], blue_rows: list[str], winner: str, plies: int) -> None:
+        """Account for one finished game; ``winner`` is ``"RED"`` or ``"BLUE"``."""
+
+        for rows, color in ((red_rows, "RED"), (blue_rows, "BLUE")):
+            played = self._encode(rows)
+            if played is None:
+                self.skipped += 1
+                continue
+            data = self._fold(played)
+            won = winner == color
+            key = self.hash_setup(data)
+            entry = self._pending.get(key)
+            if entry is None:
+                entry = self._pending[key] = [data, 0, 0, 0, 0]
+            entry[1] += 1
+            entry[2 if won else 3] += 1
+            entry[4] += plies
+
+            # heatmaps use the setup as played; folding only applies to the key
+            tokens = _TOKEN_INDEX[np.frombuffer(played, dtype=np.uint8)].reshape(self.rows, self.cols)
+            np.add.at(self.heat_games, (tokens, self._rr, self._cc), 1)
+            if won:
+                np.add.at(self.heat_wins, (tokens, self._rr, self._cc), 1)
+
+    def add_log(self, path: str | os.PathLike) -> int:
+        """Index every game in the log at ``path``; return the number of games."""
+
+        games = 0
+        for red, blue, winner, plies in iter_games(path):
+            self.add_game(red, blue, winner, plies)
+            games += 1
+        return games
+
+    def _absorb(self, keys: np.ndarray, setups: np.ndarray, counts: np.ndarray) -> None:
+        all_keys = np.concatenate([self.keys, keys])
+        unique, first, inverse = np.unique(all_keys, return_index=True, return_inverse=True)
+        merged = np.zeros((len(unique), 4), dtype=np.int64)
+        np.add.at(merged, inverse, np.concatenate([self.counts, counts]))
+        self.setups = np.concatenate([self.setups, setups])[first]
+        self.keys = unique
+        self.counts = merged
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        keys = np.fromiter(self._pending, dtype=np.uint64, count=len(self._pending))
+        values = list(self._pending.values())
+        setups = np.array([v[0] for v in values], dtype=self.setups.dtype)
+        counts = np.array([v[1:] for v in values], dtype=np.int64)
+        self._pending.clear()
+        self._absorb(keys, setups, counts)
+
+    def merge(self, other: SetupIndex) -> None:
+        """Add the statistics of ``other`` into this index."""
+
+        if (other.rows, other.cols, other.fold_mirror) != (self.rows, self.cols, self.fold_mirror):
+            raise ValueError("Cannot merge setup indexes with different layouts.")
+        self._flush()
+        other._flush()
+        self._absorb(other.keys, other.setups, other.counts)
+        self.heat_games += other.heat_games
+        self.heat_wins += other.heat_wins
+        self.skipped += other.skipped
+
+    # ------------------------------------------------------------------
+    # persistence
+    def save(self, path: str | os.PathLike) -> None:
+        self._flush()
+        np.savez_compressed(
+            path,
+            layout=np.array([self.rows, self.cols, int(self.fold_mirror), self.skipped]),
+            keys=self.keys,
+            setups=self.setups,
+            counts=self.counts,
+            heat_games=self.heat_games,
+            heat_wins=self.heat_wins,
+        )
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> SetupIndex:
+        with np.load(path) as data:
+            rows, cols, fold_mirror, skipped = (int(v) for v in data["layout"])
+            index = cls(rows, cols, bool(fold_mirror))
+            index.keys = data["keys"]
+            index.setups = data["setups"]
+            index.counts = data["counts"]
+            index.heat_games = data["heat_games"]
+            index.heat_wins = data["heat_wins"]
+            index.skipped = skipped
+        return index
+
+    # ------------------------------------------------------------------
+    # queries
+    def __len__(self) -> int:
+        self._flush()
+        return len(self.keys)
+
+    def _rows_of(self, data: bytes) -> list[str]:
+        text = data.decode("ascii")
+        return [text[i:i + self.cols] for i in range(0, len(text), self.cols)]
+
+    def lookup(self, rows: Iterable[str]) -> dict | None:
+        """Return the statistics of one setup, or ``None`` if never seen."""
+
+        self._flush()
+        data = self.canonical(rows)
+        if data is None:
+            raise ValueError("Setup does not match the index layout.")
+        key = np.uint64(self.hash_setup(data))
+        at = int(np.searchsorted(self.keys, key))
+        if at == len(self.keys) or self.keys[at] != key:
+            return None
+        return self._stats(at)
+
+    def _stats(self, at: int) -> dict:
+        games, wins, losses, plies = (int(v) for v in self.counts[at])
+        return {
+            "setup": self._rows_of(bytes(self.setups[at])),
+            "games": games,
+            "wins": wins,
+            "losses": losses,
+            "win_rate": wins / games,
+            "mean_plies": plies / games,
+        }
+
+    def top(self, n: int = 10, min_games: int = 1, by: str = "win_rate") -> list[dict]:
+        """Return the ``n`` best setups with at least ``min_games`` games."""
+
+        self._flush()
+        games = self.counts[:, GAMES]
+        eligible = np.flatnonzero(games >= min_games)
+        if by == "win_rate":
+            score = self.counts[eligible, WINS] / games[eligible]
+        elif by == "games":
+            score = games[eligible]
+        else:
+            raise ValueError("Invalid ordering. Choose 'win_rate' or 'games'.")
+        order = eligible[np.argsort(-score, kind="stable")[:n]]
+        return [self._stats(int(at)) for at in order]
+
+    def heatmap(self, token: str) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(games, win_rate)`` grids for ``token`` on every square."""
+
+        t = SETUP_TOKENS.index(token)
+        games = self.heat_games[t]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rate = np.where(games > 0, self.heat_wins[t] / games, np.nan)
+        return games, rate
+
+
+def _index_chunk(args: tuple[list[str], int, int, bool]) -> SetupIndex:
+    paths, rows, cols, fold_mirror = args
+    index = SetupIndex(rows, cols, fold_mirror)
+    for path in paths:
+        index.add_log(path)
+    index._flush()
+    return index
+
+
+def build_index(
+    paths: Iterable[str | os.PathLike],
+    workers: int = 1,
+    rows: int = 4,
+    cols: int = 10,
+    fold_mirror: bool = True,
+) -> SetupIndex:
+    """Index all logs in ``paths``, optionally spread over worker processes."""
+
+    paths = [str(Path(p)) for p in paths]
+    if workers <= 1:
+        return _index_chunk((paths, rows, cols, fold_mirror))
+
+    from multiprocessing import Pool
+
+    chunks = [(paths[i::workers], rows, cols, fold_mirror) for i in range(workers)]
+    result = SetupIndex(rows, cols, fold_mirror)
+    with Pool(workers) as pool:
+        for part in pool.imap_unordered(_index_chunk, chunks):
+            result.merge(part)
+    return result
@@ -0,0 +1,263 @@
+"""Non-blocking pub/sub of live game events for local spectators.
+
+Games publish through :class:`SpectatorHook` into a :class:`SpectatorBus`;
+:class:`SpectatorServer` serves the bus on a local TCP socket as JSON lines.
+Every subscriber owns a bounded queue that drops its oldest events when the
+subscriber falls behind, so a slow or absent spectator never delays a game.
+
+Protocol: a client sends one line, ``LIST`` (reply: one ``{"game": id}`` line
+per live game) or ``WATCH [game_id]`` (reply: the game's events until its
+``end`` event; without an id the most recently started game is watched).
+"""
+
+from __future__ import annotations
+
+import json
+import socketserver
+import threading
+from collections import deque
+from typing import Any
+
+from .hooks import GameHooks
+
+
+class Subscription:
+    """Bounded, drop-oldest queue of events for one spectator."""
+
+    def __init__(self, maxlen: int) -> None:
+        self._events: deque[dict[str, Any]] = deque(maxlen=maxlen)
+        self._ready = threading.Event()
+        self.closed = False
+
+    def push(self, event: dict[str, Any]) -> None:
+        self._events.append(event)
+        self._ready.set()
+
+    def close(self) -> None:
+        self.closed = True
+        self._ready.set()
+
+    @property
+    def drained(self) -> bool:
+        return self.closed and not self._events
+
+    def get(self, timeout: float | None = None) -> list[dict[str, Any]]:
+        """Wait for and return all pending events (possibly none on timeout)."""
+
+        self._ready.wait(timeout)
+        self._ready.clear()
+        events = []
+        while self._events:
+            events.append(self._events.popleft())
+        return events
+
+
+class SpectatorChannel:
+    """Fan-out of one game's events to its current subscribers."""
+
+    def __init__(self, maxlen: int = 256) -> None:
+        self.maxlen = maxlen
+        # replaced, never mutated, so publish can iterate without a lock
+        self._subscribers: tuple[Subscription, ...] = ()
+        self._lock = threading.Lock()
+        self.last: dict[str, Any] | None = None
+        self.closed = False
+
+    @property
+    def has_subscribers(self) -> bool:
+        return bool(self._subscribers)
+
+    def subscribe(self) -> Subscription:
+        sub = Subscription(self.maxlen)
+        with self._lock:
+            if self.last is not None:
+                # late joiners start from the last published board, which may be
+                # the opening one; the game sends a fresh board with its next move
+                sub.push(self.last)
+            if self.closed:
+                sub.close()
+            else:
+                self._subscribers = (*self._subscribers, sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            self._subscribers = tuple(s for s in self._subscribers if s is not sub)
+
+    def publish(self, event: dict[str, Any]) -> None:
+        self.last = event
+        for sub in self._subscribers:
+            sub.push(event)
+
+    def close(self) -> None:
+        with self._lock:
+            subscribers, self._subscribers = self._subscribers, ()
+            self.closed = True
+        for sub in subscribers:
+            sub.close()
+
+
+class SpectatorBus:
+    """Registry of the channels of all live games in this process."""
+
+    def __init__(self, maxlen: int = 256) -> None:
+        self.maxlen = maxlen
+        self._channels: dict[str, SpectatorChannel] = {}
+        self._lock = threading.Lock()
+
+    def open(self, game_id: str) -> SpectatorChannel:
+        with self._lock:
+            channel = self._channels[game_id] = SpectatorChannel(self.maxlen)
+        return channel
+
+    def close(self, game_id: str) -> None:
+        with self._lock:
+            channel = self._channels.pop(game_id, None)
+        if channel is not None:
+            channel.close()
+
+    def games(self) -> list[str]:
+        with self._lock:
+            return list(self._channels)
+
+    def get(self, game_id: str | None = None) -> SpectatorChannel | None:
+        with self._lock:
+            if game_id is None:
+                return next(reversed(self._channels.values()), None)
+            return self._channels.get(game_id)
+
+
+class SpectatorHook(GameHooks):
+    """Publish a game's moves and boards to a :class:`SpectatorBus`.
+
+    Boards are only rendered with ``board_to_str`` while someone is watching,
+    so a spectator joining an unwatched game sees the last rendered board
+    until the next move is played.  The channel is also closed when the game
+    is aborted, ending every ``WATCH``.
+    """
+
+    def __init__(self, bus: SpectatorBus) -> None:
+        self.bus = bus
+        self._channel: SpectatorChannel | None = None
+
+    def _board_event(self, manager, **fields: Any) -> dict[str, Any]:
+        player = manager.env.player
+        fields["game"] = manager.game_id
+        fields["to_move"] = player.name
+        fields["board"] = manager.board_to_str(player)
+        return fields
+
+    def on_setup(self, manager, raw_red, raw_blue) -> None:
+        self._channel = self.bus.open(manager.game_id)
+        # always keep the opening board so that late spectators have something to show
+        self._channel.publish(self._board_event(manager, ev="setup", turn=0))
+
+    def after_move(self, manager, ply, player, move, outcome) -> None:
+        channel = self._channel
+        if channel.has_subscribers:
+            channel.publish(
+                self._board_event(
+                    manager, ev="move", turn=ply, player=player.name, move=move, outcome=outcome
+                )
+            )
+
+    def on_game_end(self, manager, outcome, winner) -> None:
+        if self._channel is None:
+            return  # aborted before setup, or already closed
+        self._channel.publish({
+            "ev": "end",
+            "game": manager.game_id,
+            "outcome": outcome,
+            "winner": winner.name if winner is not None else None,
+        })
+        self.bus.close(manager.game_id)
+        self._channel = None
+
+
+class _SpectatorHandler(socketserver.StreamRequestHandler):
+    def _send(self, event: dict[str, Any]) -> None:
+        self.wfile.write((json.dumps(event) + "\n").encode("utf-8"))
+
+    def setup(self) -> None:
+        self.server._enter()
+        super().setup()
+
+    def finish(self) -> None:
+        try:
+            super().finish()
+        finally:
+            self.server._leave()
+
+    def handle(self) -> None:
+        bus: SpectatorBus = self.server.bus
+        words = self.rfile.readline().decode("utf-8", "replace").split()
+        command = words[0].upper() if words else ""
+        try:
+            if command == "LIST":
+                for game_id in bus.games():
+                    self._send({"game": game_id})
+            elif command == "WATCH":
+                self._watch(bus, words[1] if len(words) > 1 else None)
+            else:
+                self._send({"ev": "error", "message": "expected LIST or WATCH [game_id]"})
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _watch(self, bus: SpectatorBus, game_id: str | None) -> None:
+        channel = bus.get(game_id)
+        if channel is None:
+            self._send({"ev": "error", "message": "no such game"})
+            return
+        sub = channel.subscribe()
+        try:
+            while True:
+                events = sub.get(timeout=1.0)
+                for event in events:
+                    self._send(event)
+                if sub.drained:
+                    return
+        finally:
+            channel.unsubscribe(sub)
+
+
+class SpectatorServer(socketserver.ThreadingTCPServer):
+    """Serve a :class:`SpectatorBus` on ``host:port`` from daemon threads."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, bus: SpectatorBus, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.bus = bus
+        self._active = 0
+        self._idle = threading.Condition()
+        super().__init__((host, port), _SpectatorHandler)
+        self._thread: threading.Thread | None = None
+
+    def _enter(self) -> None:
+        with self._idle:
+            self._active += 1
+
+    def _leave(self) -> None:
+        with self._idle:
+            self._active -= 1
+            self._idle.notify_all()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def start(self) -> None:
+        """Serve in a background thread."""
+
+        self._thread = threading.Thread(target=self.serve_forever, name="spectator-server", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop serving, waiting up to ``timeout`` seconds for connected
+        spectators to receive the remaining events of their closed games."""
+
+        if self._thread is not None:
+            self.shutdown()
+        with self._idle:
+            self._idle.wait_for(lambda: self._active == 0, timeout)
+        self.server_close()
@@ -0,0 +1,117 @@
+"""Bounded background worker used to move I/O off the game loop."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class BackgroundWriter:
+    """Consume submitted items on a daemon thread in batches.
+
+    ``submit`` blocks once ``max_pending`` items are queued, which gives the
+    producer natural backpressure instead of letting memory grow without
+    bound.  Subclasses implement :meth:`_handle_batch` and optionally
+    :meth:`_finish`, both of which only ever run on the worker thread.
+    """
+
+    def __init__(
+        self,
+        max_pending: int = 1024,
+        batch_size: int = 64,
+        flush_interval: float = 0.5,
+        name: str | None = None,
+    ) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_pending)
+        self._error: BaseException | None = None
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._worker, name=name or type(self).__name__, daemon=True
+        )
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # producer side
+    def submit(self, item: Any) -> None:
+        """Queue ``item`` for the worker, blocking while the queue is full."""
+
+        if self._error is not None:
+            raise RuntimeError(f"{type(self).__name__} worker failed") from self._error
+        if self._closed:
+            raise RuntimeError(f"{type(self).__name__} is closed")
+        self._queue.put(item)
+
+    def close(self) -> None:
+        """Drain pending items and stop the worker thread."""
+
+        if self._closed:
+            return
+        self._closed = True
+        # the worker may already be gone after a failure, so never block on a full queue
+        while self._thread.is_alive():
+            try:
+                self._queue.put(_STOP, timeout=self.flush_interval)
+                break
+            except queue.Full:
+                pass
+        self._thread.join()
+        if self._error is not None:
+            raise RuntimeError(f"{type(self).__name__} worker failed") from self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # worker side
+    def _handle_batch(self, batch: list[Any]) -> None:
+        raise NotImplementedError
+
+    def _finish(self) -> None:
+        pass
+
+    def _worker(self) -> None:
+        stopping = False
+        try:
+            while not stopping:
+                try:
+                    item = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    self._handle_batch([])
+                    continue
+                batch = []
+                while True:
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        break
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                self._handle_batch(batch)
+            self._finish()
+        except BaseException as exc:  # surfaced to the producer on next call
+            logger.exception("%s worker crashed", type(self).__name__)
+            self._error = exc
+            # release a producer blocked on a full queue; once _STOP was taken
+            # nobody can be waiting, and a blocking get would never return
+            if not stopping:
+                try:
+                    while self._queue.get_nowait() is not _STOP:
+                        pass
+                except queue.Empty:
+                    pass
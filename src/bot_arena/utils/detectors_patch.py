@@ -57,19 +57,28 @@ class _AlwaysValidTwoSquareDetector:
         self.p2.clear()
 
 # ───────────────────── УСТАНАВЛИВАЕМ ПАТЧ ────────────────────────
-# В разных версиях Stratego детекторы могут лежать в разных модулях,
-# поэтому пробуем про-патчить несколько возможных мест.
-for _mod_name in (
-    "stratego.core.detectors",
-    "stratego.core.stratego",
-):
-    try:
-        _m = __import__(_mod_name, fromlist=["dummy"])
-    except ModuleNotFoundError:
-        continue
-
-    setattr(_m, "ChasingDetector", _AlwaysValidChasingDetector)
-    setattr(_m, "TwoSquareDetector", _AlwaysValidTwoSquareDetector)
-
-# После `import detectors_patch`:
+_installed = False
+
+
+def install() -> None:
+    """Установить патч (повторные вызовы ничего не делают)."""
+    global _installed
+    if _installed:
+        return
+    # В разных версиях Stratego детекторы могут лежать в разных модулях,
+    # поэтому пробуем про-патчить несколько возможных мест.
+    for mod_name in (
+        "stratego.core.detectors",
+        "stratego.core.stratego",
+    ):
+        try:
+            m = __import__(mod_name, fromlist=["dummy"])
+        except ModuleNotFoundError:
+            continue
+
+        setattr(m, "ChasingDetector", _AlwaysValidChasingDetector)
+        setattr(m, "TwoSquareDetector", _AlwaysValidTwoSquareDetector)
+    _installed = True
+
+# После `detectors_patch.install()`:
 #     env = make_env()     # все правила будут считаться выполненными
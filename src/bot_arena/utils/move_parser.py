@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from enum import IntEnum
+
 from stratego import Piece, Player
 
 TOKEN_TO_PIECE = {
@@ -58,51 +62,181 @@ def setup_to_action(setup: list[list[Piece]], turn: int, pieces_num: dict[Piece,
     raise ValueError(f"No {target_piece.name} found for turn {turn}")
 
 
-def parse_move(move: str):
-    tokens = move.strip().split()
+class Direction(IntEnum):
+    UP = 0
+    DOWN = 1
+    LEFT = 2
+    RIGHT = 3
+
+
+DIRECTION_NAMES = tuple(d.name for d in Direction)
+_DIRECTION_BY_NAME = {d.name: d for d in Direction}
+# Direction seen by the opponent, i.e. after rotating the board by 180 degrees.
+OPPOSITE = (Direction.DOWN, Direction.UP, Direction.RIGHT, Direction.LEFT)
+# (dx, dy) of a single step in each direction.
+DELTAS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+
+def _is_number(token: str) -> bool:
+    # isdigit() alone accepts e.g. "²", which int() rejects
+    return token.isascii() and token.isdecimal()
+
+
+class Move:
+    """A move in protocol coordinates: ``x y DIRECTION [MULT]``."""
+
+    __slots__ = ("x", "y", "direction", "mult")
+
+    def __init__(self, x: int, y: int, direction: int, mult: int = 1) -> None:
+        self.x = x
+        self.y = y
+        self.direction = direction
+        self.mult = mult
+
+    @classmethod
+    def decode(cls, tokens: list[str], start: int = 0, stop: int | None = None) -> Move | None:
+        """Build a move from ``tokens[start:stop]`` or return ``None`` if malformed.
+
+        The slice must hold exactly ``x y DIRECTION`` or ``x y DIRECTION MULT``.
+        """
+
+        if stop is None:
+            stop = len(tokens)
+        count = stop - start
+        if count not in (3, 4):
+            return None
+        x, y, name = tokens[start], tokens[start + 1], tokens[start + 2]
+        direction = _DIRECTION_BY_NAME.get(name.upper())
+        if direction is None or not _is_number(x) or not _is_number(y):
+            return None
+        mult = 1
+        if count == 4:
+            if not _is_number(tokens[start + 3]):
+                return None
+            mult = int(tokens[start + 3])
+        return cls(int(x), int(y), direction, mult)
+
+    def encode(self) -> str:
+        text = f"{self.x} {self.y} {DIRECTION_NAMES[self.direction]}"
+        return text if self.mult == 1 else f"{text} {self.mult}"
+
+    def rotated(self, height: int, width: int) -> Move:
+        return Move(width - 1 - self.x, height - 1 - self.y, OPPOSITE[self.direction], self.mult)
+
+    def destination(self) -> tuple[int, int]:
+        """Return the ``(row, col)`` the move ends on."""
+
+        dx, dy = DELTAS[self.direction]
+        return self.y + dy * self.mult, self.x + dx * self.mult
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Move):
+            return NotImplemented
+        return (self.x, self.y, self.direction, self.mult) == (
+            other.x, other.y, other.direction, other.mult
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y, self.direction, self.mult))
+
+    def __repr__(self) -> str:
+        return f"Move({self.encode()!r})"
+
+
+class OutcomeKind(IntEnum):
+    OK = 0
+    KILLS = 1
+    DIES = 2
+    BOTHDIE = 3
+    VICTORY_FLAG = 4
+    ILLEGAL = 5
+    SURRENDER = 6
+
+
+# Protocol token of every piece, indexed by ``Piece.value``.
+PIECE_TOKENS = ["?"] * (max(p.value for p in TOKEN_TO_PIECE.values()) + 1)
+for _token, _piece in TOKEN_TO_PIECE.items():
+    PIECE_TOKENS[_piece.value] = _token
+
+
+class Outcome:
+    """Result of a move; combat outcomes also carry both piece values.
+
+    Instances are immutable and shared: use the module constants or
+    :meth:`combat`, which hands out precomputed objects.
+    """
+
+    __slots__ = ("kind", "attacker", "defender", "text")
+
+    def __init__(self, kind: OutcomeKind, attacker: int = 0, defender: int = 0) -> None:
+        self.kind = kind
+        self.attacker = attacker
+        self.defender = defender
+        if kind in (OutcomeKind.KILLS, OutcomeKind.DIES, OutcomeKind.BOTHDIE):
+            self.text = f"{kind.name} {PIECE_TOKENS[attacker]} {PIECE_TOKENS[defender]}"
+        else:
+            self.text = kind.name
+
+    @staticmethod
+    def combat(kind: OutcomeKind, attacker: int, defender: int) -> Outcome:
+        return _COMBAT[kind][attacker][defender]
+
+    @staticmethod
+    def decode(text: str) -> Outcome | None:
+        """Parse an outcome such as ``"KILLS 3 9"``; ``None`` if malformed."""
+
+        tokens = text.split()
+        if not tokens:
+            return None
+        kind = OutcomeKind.__members__.get(tokens[0].upper())
+        if kind is None:
+            return None
+        if kind not in _COMBAT:
+            return _SIMPLE[kind]
+        if len(tokens) < 3 or tokens[1] not in TOKEN_TO_PIECE or tokens[2] not in TOKEN_TO_PIECE:
+            return None
+        return _COMBAT[kind][TOKEN_TO_PIECE[tokens[1]].value][TOKEN_TO_PIECE[tokens[2]].value]
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return f"Outcome({self.text!r})"
+
+
+_SIMPLE = {kind: Outcome(kind) for kind in OutcomeKind}
+_COMBAT = {
+    kind: [[Outcome(kind, a, d) for d in range(len(PIECE_TOKENS))] for a in range(len(PIECE_TOKENS))]
+    for kind in (OutcomeKind.KILLS, OutcomeKind.DIES, OutcomeKind.BOTHDIE)
+}
+
+OK = _SIMPLE[OutcomeKind.OK]
+VICTORY_FLAG = _SIMPLE[OutcomeKind.VICTORY_FLAG]
+ILLEGAL = _SIMPLE[OutcomeKind.ILLEGAL]
+SURRENDER = _SIMPLE[OutcomeKind.SURRENDER]
+
+
+def parse_move(move: str) -> Move | str | None:
+    """Parse a move line; protocol keywords are returned as upper-case strings."""
+
+    tokens = move.split()
     if not tokens:
         return None
-    if tokens[0].upper() in {"SURRENDER", "QUIT"}:
-        return tokens[0].upper()
-    if tokens[0].upper() == "NO_MOVE":
-        return "NO_MOVE"
-    if len(tokens) < 3:
-        return None
-    x = int(tokens[0])
-    y = int(tokens[1])
-    direction = tokens[2].upper()
-    multiplier = int(tokens[3]) if len(tokens) > 3 else 1
-    return x, y, direction, multiplier
-
-
-def rotate_move(move, height: int, width: int):
-    x, y, direction, mult = move
-    x = width - 1 - x
-    y = height - 1 - y
-    dir_map = {"UP": "DOWN", "DOWN": "UP", "LEFT": "RIGHT", "RIGHT": "LEFT"}
-    direction = dir_map[direction]
-    return x, y, direction, mult
-
-
-def dest_from_move(x: int, y: int, direction: str, multiplier: int):
-    dx, dy = 0, 0
-    if direction == "UP":
-        dy = -multiplier
-    elif direction == "DOWN":
-        dy = multiplier
-    elif direction == "LEFT":
-        dx = -multiplier
-    elif direction == "RIGHT":
-        dx = multiplier
-    else:
-        raise ValueError(f"Unknown direction: {direction}")
-    return y + dy, x + dx
+    keyword = tokens[0].upper()
+    if keyword in {"SURRENDER", "QUIT", "NO_MOVE"}:
+        return keyword
+    return Move.decode(tokens)
+
+
+def rotate_move(move: Move, height: int, width: int) -> Move:
+    return move.rotated(height, width)
+
+
+def dest_from_move(move: Move) -> tuple[int, int]:
+    return move.destination()
 
 
-def src_dest_from_move(x: int, y: int, direction: str, multiplier: int, player: Player, height: int, width: int):
-    move = (x, y, direction, multiplier)
+def src_dest_from_move(move: Move, player: Player, height: int, width: int):
     if player == Player.RED:
-        move = rotate_move(move, height, width)
-    src = (move[1], move[0])
-    dst = dest_from_move(*move)
-    return src, dst
+        move = move.rotated(height, width)
+    return (move.y, move.x), move.destination()
@@ -1,38 +1,28 @@
-import re
 from stratego import Pos, Player, StrategoConfigBase
 
 from .move_parser import (
-    parse_setup, 
-    setup_to_action, 
+    Move,
+    parse_setup,
+    setup_to_action,
     src_dest_from_move
 )
 
-_MOVE_RE = re.compile(
-    r"""^\s*                # optional leading spaces
-        \d+\s+              # turn number
-        (?:RED|BLU):\s+     # player color and colon
-        (\d+)\s+            # x coordinate
-        (\d+)\s+            # y coordinate
-        (LEFT|RIGHT|UP|DOWN) # direction
-        (?:\s+(\d+))?       # optional multiplier
-        \b                  # word boundary
-    """,
-    re.VERBOSE | re.IGNORECASE,
-)
+_COLORS = {"RED:", "BLU:"}
+
 
-def parse_line(line: str) -> tuple[int, int, str, int] | None:
+def parse_line(line: str) -> Move | None:
     """
     Parses a line like '182 BLU: 9 8 UP 5 OK'.
 
-    Returns a tuple (x, y, direction, multiplier).
-    If multiplier is not provided, returns 1.
+    Returns the move, with a multiplier of 1 if none is provided.
     If the line does not contain coordinates (e.g. SURRENDER), returns None.
     """
-    m = _MOVE_RE.match(line)
-    if not m:
+    tokens = line.split()
+    if len(tokens) < 5 or not tokens[0].isdigit() or tokens[1].upper() not in _COLORS:
         return None                     # line without a coordinate-based move
-    x, y, direction, mult = m.groups()
-    return int(x), int(y), direction.upper(), int(mult) if mult else 1
+    # the outcome follows the move, so only an optional multiplier belongs to it
+    stop = 6 if len(tokens) > 5 and tokens[5].isascii() and tokens[5].isdecimal() else 5
+    return Move.decode(tokens, 2, stop)
 
 def actions_from_log(log_path: str, config: StrategoConfigBase) -> tuple[list[Pos], list[int], int]:
 
@@ -74,7 +64,7 @@ def actions_from_log(log_path: str, config: StrategoConfigBase) -> tuple[list[Po
         if move is None:
             break
 
-        src, dest = src_dest_from_move(*move, player=player, height=config.height, width=config.width)
+        src, dest = src_dest_from_move(move, player=player, height=config.height, width=config.width)
         actions.append(src)
         actions.append(dest)
         player_ids.append(player.value)
@@ -0,0 +1,86 @@
+import threading
+
+import pytest
+
+from bot_arena.utils.background import BackgroundWriter
+
+
+class _Collector(BackgroundWriter):
+    def __init__(self, fail_on=None, fail_finish=False, gate=None, **kwargs):
+        self.items = []
+        self.gate = gate
+        self.fail_on = fail_on
+        self.fail_finish = fail_finish
+        super().__init__(**kwargs)
+
+    def _handle_batch(self, batch):
+        if self.gate is not None:
+            self.gate.wait()
+        for item in batch:
+            if item == self.fail_on:
+                raise OSError("disk full")
+            self.items.append(item)
+
+    def _finish(self):
+        if self.fail_finish:
+            raise OSError("disk full")
+
+
+def _close_errors(writer):
+    try:
+        writer.close()
+    except BaseException as exc:
+        return [exc]
+    return []
+
+
+def _close_within(writer, timeout=5.0):
+    errors = []
+    thread = threading.Thread(target=lambda: errors.extend(_close_errors(writer)), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "close() hung"
+    return errors
+
+
+def test_items_are_handled_in_order():
+    with _Collector(max_pending=4, batch_size=3) as writer:
+        for i in range(10):
+            writer.submit(i)
+    assert writer.items == list(range(10))
+
+
+def test_failing_finish_is_raised_from_close():
+    writer = _Collector(fail_finish=True)
+    writer.submit(1)
+    errors = _close_within(writer)
+    assert len(errors) == 1 and isinstance(errors[0].__cause__, OSError)
+    assert writer.items == [1]
+
+
+def test_failing_last_batch_is_raised_from_close():
+    gate = threading.Event()
+    writer = _Collector(fail_on=3, gate=gate)
+    writer.submit(0)
+    while not writer._queue.empty():  # worker holds item 0 at the gate
+        pass
+    for i in range(1, 4):
+        writer.submit(i)
+    errors = []
+    closer = threading.Thread(target=lambda: errors.extend(_close_errors(writer)), daemon=True)
+    closer.start()
+    while writer._queue.qsize() < 4:  # 1, 2, 3 and the stop marker form one batch
+        pass
+    gate.set()
+    closer.join(10)
+    assert not closer.is_alive(), "close() hung"
+    assert len(errors) == 1 and isinstance(errors[0].__cause__, OSError)
+
+
+def test_failure_is_raised_on_next_submit():
+    writer = _Collector(fail_on=0, max_pending=1)
+    writer.submit(0)
+    with pytest.raises(RuntimeError):
+        for i in range(100):
+            writer.submit(i)
+    _close_within(writer)
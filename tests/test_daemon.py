@@ -0,0 +1,64 @@
+from bot_arena.daemon import ArenaDaemon
+
+
+class _FakeProcess:
+    def __init__(self):
+        self.returncode = None
+
+    def poll(self):
+        return self.returncode
+
+
+class _FakeBot:
+    def __init__(self, path, name):
+        self.path = path
+        self.name = name
+        self.process = _FakeProcess()
+
+    def end_game(self, result=""):
+        self.process.returncode = 0
+
+
+def _daemon():
+    # skip the socket and environment set-up; only the spare bookkeeping is tested
+    daemon = ArenaDaemon.__new__(ArenaDaemon)
+    daemon._BotController = _FakeBot
+    daemon._spares = {}
+    return daemon
+
+
+def _live(daemon):
+    return sorted((name, path) for name, (path, bot) in daemon._spares.items()
+                  if bot.process.poll() is None)
+
+
+def test_matching_spare_is_reused():
+    daemon = _daemon()
+    daemon._prespawn("bots/a", "RedBot")
+    spare = daemon._spares["RedBot"][1]
+    assert daemon._controller("bots/a", "RedBot") is spare
+    assert daemon._spares == {}
+
+
+def test_only_the_latest_request_keeps_spares():
+    daemon = _daemon()
+    spawned = []
+    daemon._BotController = lambda path, name: spawned.append(_FakeBot(path, name)) or spawned[-1]
+    for path in ("bots/a", "bots/b", "bots/c"):
+        red = daemon._controller(path, "RedBot")
+        blue = daemon._controller(None, "BlueBot")
+        assert red.path == path and blue is None
+        red.end_game()
+        daemon._prespawn(path, "RedBot")
+        daemon._prespawn(None, "BlueBot")
+    assert _live(daemon) == [("RedBot", "bots/c")]
+    assert [bot.path for bot in spawned if bot.process.poll() is None] == ["bots/c"]
+
+
+def test_dead_spare_is_replaced():
+    daemon = _daemon()
+    daemon._prespawn("bots/a", "BlueBot")
+    spare = daemon._spares["BlueBot"][1]
+    spare.process.returncode = 1
+    bot = daemon._controller("bots/a", "BlueBot")
+    assert bot is not spare and bot.process.poll() is None
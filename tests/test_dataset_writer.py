@@ -0,0 +1,62 @@
+import json
+
+import numpy as np
+import pytest
+
+from bot_arena.dataset_writer import INDEX_NAME, ObservationDatasetWriter, read_game
+
+
+def _obs(value):
+    return {"board": np.full((2, 3), value, dtype=np.int8), "mask": np.array([value % 2], dtype=bool)}
+
+
+def test_interleaved_games_are_read_back_separately(tmp_path):
+    # a tiny shard size forces rolling mid-game
+    with ObservationDatasetWriter(tmp_path, max_shard_bytes=64) as writer:
+        first = writer.begin_game()
+        second = writer.begin_game("second")
+        for ply in range(20):
+            writer.record(first, _obs(ply), (ply, 0), 1, 0.0)
+            if ply % 3 == 0:
+                writer.record(second, _obs(100 + ply), (ply, 1), -1, 1.0)
+        writer.end_game(first)
+        writer.end_game(second)
+
+    index = json.loads((tmp_path / INDEX_NAME).read_text())
+    assert len(index["shards"]) > 1
+    assert {game["id"]: game["plies"] for game in index["games"]} == {first: 20, "second": 7}
+
+    game = read_game(tmp_path, first)
+    np.testing.assert_array_equal(game["obs.board"][:, 0, 0], np.arange(20))
+    np.testing.assert_array_equal(game["action"][:, 0], np.arange(20))
+    assert (game["player"] == 1).all()
+
+    game = read_game(tmp_path, "second")
+    np.testing.assert_array_equal(game["obs.board"][:, 1, 2], 100 + np.arange(0, 20, 3))
+    np.testing.assert_array_equal(game["obs.mask"][:, 0], np.arange(0, 20, 3) % 2 == 1)
+    assert (game["reward"] == 1.0).all()
+
+
+def test_contiguous_game_uses_one_segment(tmp_path):
+    with ObservationDatasetWriter(tmp_path) as writer:
+        game_id = writer.begin_game()
+        for ply in range(5):
+            writer.record(game_id, np.arange(3) + ply, (ply,), 1, 0.0)
+        writer.end_game(game_id)
+
+    index = json.loads((tmp_path / INDEX_NAME).read_text())
+    assert index["games"] == [
+        {"id": game_id, "plies": 5, "segments": [[0, 0, 5]], "complete": True}
+    ]
+    np.testing.assert_array_equal(read_game(tmp_path, game_id)["obs"][:, 0], np.arange(5))
+
+
+def test_unfinished_games_are_marked_incomplete(tmp_path):
+    with ObservationDatasetWriter(tmp_path) as writer:
+        game_id = writer.begin_game()
+        writer.record(game_id, np.zeros(3), (0,), 1, 0.0)
+
+    index = json.loads((tmp_path / INDEX_NAME).read_text())
+    assert index["games"][0]["complete"] is False
+    with pytest.raises(KeyError):
+        read_game(tmp_path, "missing")
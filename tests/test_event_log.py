@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("gymnasium")
+stratego = pytest.importorskip("stratego")
+
+from bot_arena.event_log import GameEventLog, events_to_text, read_events, segment_path
+from bot_arena.game_manager import GameManager
+
+Piece, Player = stratego.Piece, stratego.Player
+
+
+class _Config:
+    width = height = 10
+    p1_pieces = p2_pieces = {
+        Piece(i): int(Piece(i) in (Piece.FLAG, Piece.BOMB)) for i in range(2, 14)
+    }
+    p1_pieces_num = p2_pieces_num = [1, 1]
+
+
+class _ScriptedEnv:
+    """Accepts every move except the ``illegal_checks``-th two-square checks
+    and the ``blocked_selects``-th piece selections."""
+
+    def __init__(self, plies, illegal_checks=(), blocked_selects=()):
+        self.plies = plies
+        self.illegal_checks = set(illegal_checks)
+        self.blocked_selects = set(blocked_selects)
+        self.two_square_detector = self
+        self.board = np.zeros((10, 10), dtype=np.int64)
+
+    def reset(self):
+        self.player = Player.RED
+        self._setup_left = 4
+        self._selected = False
+        self._moves = 0
+        self._checks = 0
+        self._selects = 0
+
+    def step(self, action):
+        term = False
+        if self._setup_left:
+            self._setup_left -= 1
+        elif not self._selected:
+            self._selected = True
+        else:
+            self._selected = False
+            self._moves += 1
+            self.player = Player(-self.player)
+            term = self._moves >= self.plies
+        return np.zeros(3, dtype=np.float32), 0.0, term, False, {}
+
+    def valid_pieces_to_select(self):
+        self._selects += 1
+        return np.full((10, 10), self._selects not in self.blocked_selects)
+
+    def valid_destinations(self):
+        return np.ones((10, 10), dtype=bool)
+
+    def validate_move(self, player, piece, src, dst):
+        self._checks += 1
+        return self._checks not in self.illegal_checks
+
+
+class _ScriptedBot:
+    def __init__(self, path, setup, moves):
+        self.path = self.name = path
+        self._setup = setup
+        self._moves = iter(moves)
+
+    def setup(self, **kwargs):
+        return self._setup
+
+    def request_move(self, last_move, outcome, board):
+        return next(self._moves)
+
+    def confirm_result(self, move, outcome):
+        pass
+
+    def end_game(self, result):
+        pass
+
+
+@pytest.mark.parametrize("compression", [None, "gzip", "zstd"])
+def test_events_reproduce_text_log(tmp_path, compression):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    red = _ScriptedBot("bots/red", "FB", ["3 4 UP", "3 3 UP 2", "5 5 LEFT", "5 5 RIGHT"])
+    blue = _ScriptedBot("bots/blue", "BF", ["6 6 DOWN", "6 7 DOWN 2", "1 1 RIGHT"])
+    events = GameEventLog(
+        tmp_path / "events.jsonl", compression=compression, max_bytes=64, batch_size=1
+    )
+    manager = GameManager(
+        _Config(), red, blue, render_mode=None, log_file=str(tmp_path / "game.log"),
+        event_log=events, env=_ScriptedEnv(plies=6, illegal_checks={5}),
+    )
+    manager.run()
+    events.close()
+
+    assert segment_path(events.path, 1).exists()
+    text = (tmp_path / "game.log").read_text(encoding="utf-8").splitlines()
+    assert "(2‑square)" in text[-4]
+    assert list(events_to_text(read_events(events.path))) == text
+    assert list(events_to_text(read_events(events.path), game=manager.game_id)) == text
+
+
+@pytest.mark.parametrize(
+    "last_move, reason, blocked",
+    [("3 4 UP abc", "no_move", ()), ("NO_MOVE", "no_move", ()), ("3 3 UP", "invalid_select", {3})],
+)
+def test_terminating_illegal_moves_are_recorded(tmp_path, last_move, reason, blocked):
+    red = _ScriptedBot("bots/red", "FB", ["3 4 UP", last_move])
+    blue = _ScriptedBot("bots/blue", "BF", ["6 6 DOWN"])
+    events = GameEventLog(tmp_path / "events.jsonl")
+    manager = GameManager(
+        _Config(), red, blue, render_mode=None, log_file=str(tmp_path / "game.log"),
+        event_log=events, env=_ScriptedEnv(plies=10, blocked_selects=blocked),
+    )
+    manager.run()
+    events.close()
+
+    recorded = list(read_events(events.path))
+    illegal = [event for event in recorded if event["ev"] == "illegal"]
+    assert [(e["turn"], e["color"], e["move"], e["reason"]) for e in illegal] == [
+        (3, "RED", last_move, reason)
+    ]
+    text = (tmp_path / "game.log").read_text(encoding="utf-8").splitlines()
+    assert list(events_to_text(recorded)) == text
@@ -0,0 +1,54 @@
+from bot_arena.hooks import HOOK_NAMES, CProfileHook, GameHooks, StackSamplerHook, bind_hooks
+
+
+class _Recorder(GameHooks):
+    def __init__(self, calls, tag):
+        self.calls = calls
+        self.tag = tag
+
+    def after_move(self, manager, ply, player, move, outcome):
+        self.calls.append((self.tag, ply, move))
+
+
+class _DuckHook:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def on_game_end(self, manager, outcome, winner):
+        self.calls.append(("duck", outcome))
+
+
+def test_no_hooks_bind_nothing():
+    assert bind_hooks([]) == dict.fromkeys(HOOK_NAMES)
+    assert bind_hooks([GameHooks()]) == dict.fromkeys(HOOK_NAMES)
+
+
+def test_only_overridden_callbacks_are_bound():
+    calls = []
+    hook = _Recorder(calls, "a")
+    bound = bind_hooks([hook, _DuckHook(calls)])
+    assert bound["after_move"] == hook.after_move
+    assert bound["on_setup"] is None and bound["before_move"] is None
+    bound["on_game_end"](None, "OK", None)
+    assert calls == [("duck", "OK")]
+
+
+def test_several_hooks_fan_out_in_order():
+    calls = []
+    bound = bind_hooks([_Recorder(calls, "a"), GameHooks(), _Recorder(calls, "b")])
+    bound["after_move"](None, 3, None, "3 4 UP", "OK")
+    assert calls == [("a", 3, "3 4 UP"), ("b", 3, "3 4 UP")]
+
+
+class _Manager:
+    game_id = "game"
+
+
+def test_profilers_tolerate_teardown_without_setup_and_twice(tmp_path):
+    for hook in (CProfileHook(str(tmp_path / "{game}.pstats")),
+                 StackSamplerHook(path=str(tmp_path / "{game}.folded"))):
+        hook.on_game_end(_Manager(), "ABORTED", None)
+        hook.on_setup(_Manager(), None, None)
+        hook.on_game_end(_Manager(), "OK", None)
+        hook.on_game_end(_Manager(), "ABORTED", None)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["game.folded", "game.pstats"]
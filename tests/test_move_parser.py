@@ -0,0 +1,71 @@
+import pytest
+
+from bot_arena.utils.move_parser import (
+    ILLEGAL,
+    OK,
+    Direction,
+    Move,
+    Outcome,
+    OutcomeKind,
+    TOKEN_TO_PIECE,
+    parse_move,
+)
+from bot_arena.utils.output_translator import parse_line
+
+
+@pytest.mark.parametrize("text", ["3 4 UP", "0 9 LEFT", "9 8 UP 5", "2 6 RIGHT 3"])
+def test_move_round_trip(text):
+    move = Move.decode(text.split())
+    assert move is not None
+    assert move.encode() == text
+    assert Move.decode(move.encode().split()) == move
+
+
+@pytest.mark.parametrize("text", ["OK", "VICTORY_FLAG", "ILLEGAL", "KILLS 3 9", "DIES s 1", "BOTHDIE 5 5"])
+def test_outcome_round_trip(text):
+    outcome = Outcome.decode(text)
+    assert outcome is not None
+    assert outcome.text == text
+    assert Outcome.decode(outcome.text) is outcome
+
+
+def test_combat_outcomes_are_shared():
+    attacker, defender = TOKEN_TO_PIECE["3"].value, TOKEN_TO_PIECE["9"].value
+    outcome = Outcome.combat(OutcomeKind.KILLS, attacker, defender)
+    assert outcome is Outcome.decode("KILLS 3 9")
+    assert (outcome.attacker, outcome.defender) == (attacker, defender)
+
+
+def test_parse_move():
+    assert parse_move("3 4 up") == Move(3, 4, Direction.UP)
+    assert parse_move("3 4 UP 2") == Move(3, 4, Direction.UP, 2)
+    assert parse_move("surrender") == "SURRENDER"
+    assert parse_move("") is None
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["3 4 UP abc", "3 4 UP 2 7", "3 4 SIDEWAYS", "a 4 UP", "3 4", "3 4 UP ²", "³ 4 UP", "3 ٤ UP"],
+)
+def test_parse_move_rejects_malformed(text):
+    assert parse_move(text) is None
+
+
+def test_parse_line_with_multiplier():
+    assert parse_line("182 BLU: 9 8 UP 5 OK") == Move(9, 8, Direction.UP, 5)
+    assert parse_line("182 BLU: ² 8 UP OK") is None
+
+
+def test_parse_line_with_combat_outcome():
+    assert parse_line("7 RED: 3 6 DOWN KILLS 3 9") == Move(3, 6, Direction.DOWN)
+    assert parse_line("8 BLU: 1 2 LEFT 2 BOTHDIE 9 9") == Move(1, 2, Direction.LEFT, 2)
+
+
+def test_parse_line_with_two_square_rule():
+    line = f"12 RED: 4 5 RIGHT {ILLEGAL} (2‑square)"
+    assert parse_line(line) == Move(4, 5, Direction.RIGHT)
+
+
+def test_parse_line_without_move():
+    assert parse_line(f"3 RED: SURRENDER {OK}") is None
+    assert parse_line("RED SETUP") is None
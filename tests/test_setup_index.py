@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from bot_arena.setup_index import SetupIndex, build_index, iter_games
+
+SETUP = ["FB98765432", "1s99999888", "BB77766655", "5544443333"]
+MIRROR = [row[::-1] for row in SETUP]
+OTHER = ["BF98765432", "1s99999888", "BB77766655", "5544443333"]
+
+
+def _log(red, blue, winner, plies):
+    moves = [f"{i} {'RED' if i % 2 else 'BLU'}: 3 4 UP OK" for i in range(1, plies + 1)]
+    return [
+        "bots/red RED SETUP", *red, "bots/blue BLUE SETUP", *blue, *moves,
+        f"bots/{winner.lower()} {winner} VICTORY {plies} 30 29",
+    ]
+
+
+def test_iter_games_reads_concatenated_games(tmp_path):
+    unfinished = _log(OTHER, SETUP, "RED", 2)[:-1]
+    lines = _log(SETUP, MIRROR, "RED", 3) + unfinished + _log(OTHER, SETUP, "BLUE", 4)
+    path = tmp_path / "games.log"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    games = list(iter_games(path))
+    assert games == [(SETUP, MIRROR, "RED", 3), (OTHER, SETUP, "BLUE", 4)]
+
+
+def test_mirror_images_share_an_entry():
+    index = SetupIndex()
+    index.add_game(SETUP, OTHER, "RED", 10)
+    index.add_game(OTHER, MIRROR, "RED", 20)
+
+    assert len(index) == 2
+    stats = index.lookup(MIRROR)
+    assert stats == index.lookup(SETUP)
+    assert (stats["games"], stats["wins"], stats["losses"]) == (2, 1, 1)
+    assert stats["mean_plies"] == 15
+    assert index.lookup(["FFFFFFFFFF"] * 4) is None
+
+
+def test_without_folding_mirrors_are_separate():
+    index = SetupIndex(fold_mirror=False)
+    index.add_game(SETUP, MIRROR, "BLUE", 10)
+    assert len(index) == 2
+    assert index.lookup(SETUP)["losses"] == 1
+    assert index.lookup(MIRROR)["wins"] == 1
+
+
+def test_heatmaps_use_the_setup_as_played():
+    index = SetupIndex()
+    index.add_game(SETUP, MIRROR, "RED", 10)
+    games, rate = index.heatmap("F")
+    assert games[0, 0] == 1 and games[0, 9] == 1
+    assert rate[0, 0] == 1.0 and rate[0, 9] == 0.0
+    assert np.isnan(rate[1, 0])
+
+
+def test_malformed_setups_are_skipped():
+    index = SetupIndex()
+    index.add_game(SETUP[:3], ["FB9876543X", *SETUP[1:]], "RED", 10)
+    assert index.skipped == 2 and len(index) == 0
+    with pytest.raises(ValueError):
+        index.lookup(SETUP[:3])
+
+
+def test_merge_save_and_load(tmp_path):
+    first, second = SetupIndex(), SetupIndex()
+    first.add_game(SETUP, OTHER, "RED", 10)
+    second.add_game(MIRROR, OTHER, "BLUE", 30)
+    second.add_game(SETUP[:2], OTHER, "BLUE", 30)
+    first.merge(second)
+
+    first.save(tmp_path / "setups.npz")
+    loaded = SetupIndex.load(tmp_path / "setups.npz")
+    assert loaded.skipped == 1 and len(loaded) == 2
+    assert loaded.lookup(SETUP) == first.lookup(SETUP)
+    assert (loaded.lookup(SETUP)["games"], loaded.lookup(OTHER)["wins"]) == (2, 2)
+    np.testing.assert_array_equal(loaded.heat_games, first.heat_games)
+    np.testing.assert_array_equal(loaded.heat_wins, first.heat_wins)
+    best = loaded.top(n=1, by="games")[0]
+    assert best["games"] == 3 and loaded.lookup(best["setup"]) == loaded.lookup(OTHER)
+
+    with pytest.raises(ValueError):
+        first.merge(SetupIndex(fold_mirror=False))
+
+
+def test_build_index_matches_add_log(tmp_path):
+    paths = []
+    for i, winner in enumerate(["RED", "BLUE", "RED"]):
+        path = tmp_path / f"{i}.log"
+        path.write_text("\n".join(_log(SETUP, OTHER, winner, 5)) + "\n", encoding="utf-8")
+        paths.append(path)
+    index = build_index(paths)
+    assert index.lookup(SETUP)["wins"] == 2
+    assert index.lookup(OTHER)["wins"] == 1
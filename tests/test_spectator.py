@@ -0,0 +1,87 @@
+import json
+import socket
+
+from bot_arena.spectator import (
+    SpectatorBus,
+    SpectatorChannel,
+    SpectatorHook,
+    SpectatorServer,
+    Subscription,
+)
+
+
+def test_subscription_drops_oldest_events():
+    sub = Subscription(maxlen=3)
+    for i in range(5):
+        sub.push({"turn": i})
+    assert [event["turn"] for event in sub.get(timeout=0)] == [2, 3, 4]
+    assert sub.get(timeout=0) == []
+    sub.push({"turn": 5})
+    sub.close()
+    assert not sub.drained
+    assert sub.get(timeout=0) == [{"turn": 5}]
+    assert sub.drained
+
+
+def test_late_subscribers_start_from_the_last_event():
+    channel = SpectatorChannel(maxlen=4)
+    channel.publish({"ev": "setup"})
+    channel.publish({"ev": "move"})
+    sub = channel.subscribe()
+    assert channel.has_subscribers
+    channel.publish({"ev": "end"})
+    assert sub.get(timeout=0) == [{"ev": "move"}, {"ev": "end"}]
+
+    channel.close()
+    assert sub.drained and not channel.has_subscribers
+    late = channel.subscribe()
+    assert late.get(timeout=0) == [{"ev": "end"}] and late.drained
+
+
+def test_bus_tracks_live_games():
+    bus = SpectatorBus()
+    first, second = bus.open("a"), bus.open("b")
+    assert bus.games() == ["a", "b"]
+    assert bus.get() is second and bus.get("a") is first and bus.get("c") is None
+    bus.close("b")
+    assert second.closed and bus.games() == ["a"]
+
+
+def test_hook_teardown_without_setup_is_a_no_op():
+    hook = SpectatorHook(SpectatorBus())
+    hook.on_game_end(None, "ABORTED", None)
+    hook.on_game_end(None, "ABORTED", None)
+
+
+class _Player:
+    name = "RED"
+
+
+class _Env:
+    player = _Player()
+
+
+class _Manager:
+    game_id = "game"
+    env = _Env()
+
+    def board_to_str(self, player):
+        return ["..."]
+
+
+def test_stop_lets_watchers_receive_the_end_event():
+    bus = SpectatorBus()
+    server = SpectatorServer(bus)
+    server.start()
+    hook = SpectatorHook(bus)
+    hook.on_setup(_Manager(), None, None)
+
+    with socket.create_connection(("127.0.0.1", server.port)) as client:
+        client.sendall(b"WATCH game\n")
+        stream = client.makefile("r", encoding="utf-8")
+        assert json.loads(stream.readline())["ev"] == "setup"
+
+        hook.on_game_end(_Manager(), "OK", None)
+        server.stop()
+        assert json.loads(stream.readline())["ev"] == "end"
+        assert stream.readline() == ""